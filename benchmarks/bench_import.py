@@ -0,0 +1,101 @@
+"""Measure the integration's import cost and what is deferred to the first calculation.
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 10
+
+Each measurement runs in a fresh interpreter. Importing the calculation modules
+(what HA pays while loading the integration) is measured with -X importtime as
+the sum of the self time of every module imported; interpreter start-up imports
+are left out, and standard-library modules that HA has already loaded by the time
+the integration is set up are still counted, so the integration's real share is
+lower. The first get_molad call (paid later, in the coordinator's executor thread)
+is timed by the clock, split into building the lazy month index and the cold
+calculation itself, with a second, warm call for comparison.
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+BENCH_DIR = Path(__file__).resolve().parent
+
+IMPORT = "from loader import load_helper_module; helper = load_helper_module()"
+FIRST_CALL = (
+    "from datetime import datetime; from time import perf_counter; from zoneinfo import ZoneInfo; "
+    "now = datetime.now(ZoneInfo('America/New_York')); "
+    "h = helper.MoladHelper(40.7128, -74.006, 'America/New_York'); "
+    "t0 = perf_counter(); h.engine._month_index(); t1 = perf_counter(); "
+    "h.get_molad(now); t2 = perf_counter(); h.get_molad(now); t3 = perf_counter(); "
+    "sys.stderr.write(f'first call: {(t1 - t0) * 1e6:.0f} {(t2 - t1) * 1e6:.0f} {(t3 - t2) * 1e6:.0f}\\n')"
+)
+MARKER = "import sys; sys.stderr.write('import time: ---\\n'); "
+FIRST_CALL_PARTS = ("month index build", "cold get_molad", "warm get_molad")  # the last is not in the total
+
+
+def import_times(code: str) -> tuple[list[dict[str, int]], list[int]]:
+    """Run code in a fresh interpreter.
+
+    Returns the self time (us) per module for each marker-separated phase, and the
+    clock times (us) of the first call's parts.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BENCH_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    phases: list[dict[str, int]] = [{}]
+    first_call: list[int] = []
+    for line in proc.stderr.splitlines():
+        if line.startswith("first call:"):
+            first_call = [int(us) for us in line.split(":")[1].split()]
+            continue
+        if not line.startswith("import time:"):
+            continue
+        if line.endswith("---"):
+            phases.append({})
+            continue
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[0].split(":")[1].strip().isdigit():
+            continue  # header line
+        module = fields[2].strip()
+        phases[-1][module] = int(fields[0].split(":")[1])
+    return phases, first_call
+
+
+def group(times: dict[str, int]) -> dict[str, int]:
+    """Sum self times by top-level package."""
+    totals: dict[str, int] = {}
+    for module, us in times.items():
+        top = module.split(".")[0]
+        totals[top] = totals.get(top, 0) + us
+    return totals
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="interpreter runs to take the median of")
+    args = parser.parse_args()
+
+    runs = [import_times(f"{MARKER}{IMPORT}; {MARKER}{FIRST_CALL}") for _ in range(args.repeat)]
+    grouped = [group(phases[1]) for phases, _ in runs]
+    packages = sorted({p for g in grouped for p in g}, key=lambda p: -statistics.median(g.get(p, 0) for g in grouped))
+    total = statistics.median(sum(g.values()) for g in grouped)
+    print(f"integration import: {total / 1000:.1f} ms (median of {args.repeat})")
+    for package in packages[:8]:
+        print(f"  {package:<24}{statistics.median(g.get(package, 0) for g in grouped) / 1000:>8.1f} ms")
+
+    first_calls = [first_call for _, first_call in runs]
+    deferred = statistics.median(sum(parts[:2]) for parts in first_calls)
+    print(f"deferred to first calculation: {deferred / 1000:.1f} ms (median of {args.repeat})")
+    for i, part in enumerate(FIRST_CALL_PARTS):
+        print(f"  {part:<24}{statistics.median(parts[i] for parts in first_calls) / 1000:>8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
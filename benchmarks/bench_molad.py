@@ -0,0 +1,224 @@
+"""Benchmark and verify the MoladHelper hot paths over a full calendar range.
+
+Runs without Home Assistant or network access (only hdate[astral] is needed, for
+the reference implementation):
+
+    python benchmarks/bench_molad.py                      # 1800-2100, every day
+    python benchmarks/bench_molad.py --start 2000-01-01 --end 2050-12-31 --json out.json
+    python benchmarks/bench_molad.py --verify             # exhaustive check against reference.py
+
+Each target gets a fresh MoladHelper, so caches start cold exactly as after an
+HA restart. Latency is reported as percentiles of individual calls.
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, time, timedelta
+import json
+from pathlib import Path
+import sys
+from time import perf_counter_ns
+from zoneinfo import ZoneInfo
+
+from loader import load_helper_module, load_module
+import reference
+
+helper_module = load_helper_module()
+MoladEngine = helper_module.MoladEngine
+MoladHelper = helper_module.MoladHelper
+solar = load_module("solar")
+
+# Sites for the multi-site benchmark and verification, spanning both of hdate's solar
+# methods (astral up to 50 degrees latitude, the NOAA low accuracy equations beyond)
+SITES = [
+    solar.Site(40.7128, -74.0060, "America/New_York"),
+    solar.Site(31.7780, 35.2354, "Asia/Jerusalem", False),
+    solar.Site(34.0522, -118.2437, "America/Los_Angeles"),
+    solar.Site(51.5072, -0.1276, "Europe/London"),
+    solar.Site(-33.8688, 151.2093, "Australia/Sydney"),
+    solar.Site(59.3293, 18.0686, "Europe/Stockholm"),
+    solar.Site(-34.6037, -58.3816, "America/Argentina/Buenos_Aires"),
+    solar.Site(64.1466, -21.9426, "Atlantic/Reykjavik"),
+]
+
+
+@dataclass
+class Result:
+    """Timing summary for one benchmark target."""
+
+    name: str
+    calls: int
+    total_s: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    max_us: float
+    calls_per_s: float
+
+
+def measure(name: str, func: Callable, args: Iterable[tuple]) -> Result:
+    """Call func once per argument tuple and summarize the per-call latency."""
+    samples = []
+    for call_args in args:
+        start = perf_counter_ns()
+        func(*call_args)
+        samples.append(perf_counter_ns() - start)
+
+    samples.sort()
+    total = sum(samples) / 1e9
+
+    def pct(p: float) -> float:
+        return samples[int(p / 100 * (len(samples) - 1))] / 1000
+
+    return Result(name, len(samples), total, pct(50), pct(90), pct(99), samples[-1] / 1000, len(samples) / total)
+
+
+def daterange(start: date, end: date, step: int = 1) -> list[date]:
+    """Every step-th day from start to end inclusive."""
+    return [start + timedelta(days=i) for i in range(0, (end - start).days + 1, step)]
+
+
+def hebrew_months(engine: MoladEngine, start: date, end: date) -> list[tuple[int, int]]:
+    """All (year, BIBLICAL month) pairs for the Hebrew years spanning start..end."""
+    first = engine.dates.hebrew_from_gdate(start).year
+    last = engine.dates.hebrew_from_gdate(end).year
+    return [
+        (year, month)
+        for year in range(first, last + 1)
+        for month in range(1, 14 if engine._is_leap_year(year) else 13)
+    ]
+
+
+def run_benchmarks(args: argparse.Namespace) -> list[Result]:
+    """Time every hot path over the requested range."""
+    tz = ZoneInfo(args.timezone)
+    days = daterange(args.start, args.end, args.step)
+    moments = [datetime.combine(day, args.time, tzinfo=tz) for day in days]
+
+    def fresh() -> MoladHelper:
+        return MoladHelper(args.latitude, args.longitude, args.timezone, args.diaspora)
+
+    months = hebrew_months(MoladEngine(), args.start, args.end)
+    years, biblical = [m[0] for m in months], [m[1] for m in months]
+    fridays = [day for day in days if day.weekday() == 4]
+
+    results = [
+        measure("_molad_raw", fresh().engine._molad_raw, months),
+        measure("molad_raw_batch (per month)", lambda: fresh().engine.molad_raw_batch(years, biblical), [()]),
+        measure("get_actual_molad", fresh().get_actual_molad, ((d,) for d in days)),
+        measure("get_rosh_chodesh_days", fresh().get_rosh_chodesh_days, ((d,) for d in days)),
+        measure("_shabbos_mevorchim_date", fresh()._shabbos_mevorchim_date, ((d,) for d in days)),
+        measure("next_month_start", fresh().engine.next_month_start, ((d,) for d in days)),
+        measure("is_shabbos_mevorchim", fresh().is_shabbos_mevorchim, ((m,) for m in moments)),
+        measure("get_molad", fresh().get_molad, ((m,) for m in moments)),
+        measure("shabbat_windows (per site-week)", lambda: solar.shabbat_windows(SITES, fridays), [()]),
+    ]
+
+    # The batches are single calls; report them per element
+    for i, elements in ((1, len(months)), (-1, len(SITES) * len(fridays))):
+        batch = results[i]
+        per = batch.total_s / elements * 1e6
+        results[i] = Result(batch.name, elements, batch.total_s, per, per, per, per, elements / batch.total_s)
+    return results
+
+
+def print_results(results: list[Result]) -> None:
+    """Print a fixed-width results table."""
+    header = f"{'target':<30}{'calls':>10}{'total s':>10}{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}{'max us':>10}{'calls/s':>12}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r.name:<30}{r.calls:>10}{r.total_s:>10.3f}{r.p50_us:>10.1f}{r.p90_us:>10.1f}"
+            f"{r.p99_us:>10.1f}{r.max_us:>10.1f}{r.calls_per_s:>12.0f}"
+        )
+
+
+def verify(args: argparse.Namespace) -> int:
+    """Compare every optimized path against reference.py for every day in range. Returns mismatch count."""
+    tz = ZoneInfo(args.timezone)
+    mismatches = 0
+
+    def check(what: str, got, expected) -> None:
+        nonlocal mismatches
+        if got != expected:
+            mismatches += 1
+            if mismatches <= 20:
+                print(f"MISMATCH {what}: got {got!r}, expected {expected!r}")
+
+    engine = MoladEngine()
+    months = hebrew_months(engine, args.start, args.end)
+    batch = engine.molad_raw_batch([m[0] for m in months], [m[1] for m in months])
+    for i, (year, month) in enumerate(months):
+        expected = reference.molad_raw(year, month)
+        check(f"_molad_raw{(year, month)}", engine._molad_raw(year, month), expected)
+        check(f"molad_raw_batch{(year, month)}", tuple(column[i] for column in batch), expected)
+
+    fridays = [day for day in daterange(args.start, args.end, args.step) if day.weekday() == 4]
+    windows = solar.shabbat_windows(SITES, fridays)
+    for site, row in zip(SITES, windows):
+        site_location = reference.location(site.latitude, site.longitude, site.time_zone, site.diaspora)
+        for friday, window in zip(fridays, row):
+            check(f"shabbat_windows({site}, {friday})", tuple(window), reference.shabbat_window(site_location, friday))
+
+    direct = MoladHelper(args.latitude, args.longitude, args.timezone, args.diaspora)
+    tabled = MoladHelper(args.latitude, args.longitude, args.timezone, args.diaspora)
+    location = reference.location(args.latitude, args.longitude, args.timezone, args.diaspora)
+
+    for day in daterange(args.start, args.end, args.step):
+        if not tabled.engine.year_table_covers(day):
+            tabled.engine.load_year_table(MoladEngine().build_year_table(day))
+
+        expected_rosh = reference.rosh_chodesh(day)
+        now = datetime.combine(day, args.time, tzinfo=tz)
+        for label, helper in (("direct", direct), ("table", tabled)):
+            rosh = helper.get_rosh_chodesh_days(day)
+            check(f"{label} get_actual_molad({day})", helper.get_actual_molad(day).friendly, reference.actual_molad(day))
+            check(f"{label} get_rosh_chodesh_days({day})", (rosh.month, list(rosh.gdays)), expected_rosh)
+            check(
+                f"{label} _shabbos_mevorchim_date({day})",
+                helper._shabbos_mevorchim_date(day),
+                reference.shabbos_mevorchim_date(day),
+            )
+            if day.weekday() in (4, 5):  # the answer is always False on other days
+                check(
+                    f"{label} is_shabbos_mevorchim({now})",
+                    helper.is_shabbos_mevorchim(now),
+                    reference.is_shabbos_mevorchim(location, now),
+                )
+
+    print(
+        f"verified {len(months)} months, {(args.end - args.start).days // args.step + 1} days "
+        f"and {len(SITES) * len(fridays)} site-weeks: {mismatches} mismatches"
+    )
+    return mismatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start", type=date.fromisoformat, default=date(1800, 1, 1))
+    parser.add_argument("--end", type=date.fromisoformat, default=date(2100, 12, 31))
+    parser.add_argument("--step", type=int, default=1, help="use every N-th day")
+    parser.add_argument("--time", type=time.fromisoformat, default=time(21, 0), help="local time of day for Shabbat checks")
+    parser.add_argument("--latitude", type=float, default=40.7128)
+    parser.add_argument("--longitude", type=float, default=-74.0060)
+    parser.add_argument("--timezone", default="America/New_York")
+    parser.add_argument("--israel", dest="diaspora", action="store_false")
+    parser.add_argument("--verify", action="store_true", help="check optimized paths against reference.py")
+    parser.add_argument("--json", type=Path, help="also write results to this JSON file")
+    args = parser.parse_args()
+
+    if args.verify:
+        return 1 if verify(args) else 0
+
+    results = run_benchmarks(args)
+    print_results(results)
+    if args.json:
+        args.json.write_text(json.dumps([asdict(r) for r in results], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""Import the integration's calculation modules without Home Assistant."""
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_module(name: str):
+    """Import custom_components.molad.<name>; the package itself does not import Home Assistant."""
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    return importlib.import_module(f"custom_components.molad.{name}")
+
+
+def load_helper_module():
+    """Import custom_components.molad.helper."""
+    return load_module("helper")
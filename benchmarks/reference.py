@@ -0,0 +1,126 @@
+"""Straightforward reference calculations for verifying the optimized molad paths.
+
+Everything here goes directly through hdate with no caching, precomputed tables
+or shortcuts, following the original MoladHelper algorithm step by step.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import hdate
+from hdate.hebrew_date import HebrewDate, Months
+
+CHALAKIM_PER_HOUR = 1080
+CHALAKIM_PER_DAY = 24 * CHALAKIM_PER_HOUR
+CHALAKIM_PER_WEEK = 7 * CHALAKIM_PER_DAY
+LUNAR_MONTH_CHALAKIM = 29 * CHALAKIM_PER_DAY + 12 * CHALAKIM_PER_HOUR + 793
+LEAP_YEARS_IN_CYCLE = {3, 6, 8, 11, 14, 17, 19}
+DAY_NAMES = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Shabbos"]
+
+
+def is_leap_year(year: int) -> bool:
+    """Check if a Hebrew year is a leap year."""
+    return (year % 19 or 19) in LEAP_YEARS_IN_CYCLE
+
+
+def civil_to_biblical_month(month: int) -> int:
+    """Convert hdate.Months values to biblical numbering (Nisan=1, Adar II=13)."""
+    return Months(month).biblical_order
+
+
+def molad_raw(year: int, month: int) -> tuple[int, int, int, int]:
+    """Molad of a Hebrew month (BIBLICAL numbering) as (day, hours, minutes, chalakim)."""
+    cycles, remaining = divmod(year - 1, 19)
+    total_months = cycles * 235 + sum(13 if y in LEAP_YEARS_IN_CYCLE else 12 for y in range(1, remaining + 1))
+    if month >= 7:
+        total_months += month - 7
+    else:
+        total_months += (7 if is_leap_year(year) else 6) + month - 1
+
+    total = total_months * LUNAR_MONTH_CHALAKIM + CHALAKIM_PER_DAY + 5 * CHALAKIM_PER_HOUR + 204
+    total %= CHALAKIM_PER_WEEK
+    parts = total % CHALAKIM_PER_DAY % CHALAKIM_PER_HOUR
+    return total // CHALAKIM_PER_DAY + 1, total % CHALAKIM_PER_DAY // CHALAKIM_PER_HOUR, parts // 18, parts % 18
+
+
+def hebrew_month_year(gdate: date) -> tuple[int, int]:
+    """Hebrew (year, month) of a Gregorian date, in hdate's CIVIL numbering."""
+    h = HebrewDate.from_gdate(gdate)
+    return h.year, int(h.month)
+
+
+def next_hebrew_month(year: int, month: int) -> tuple[int, int]:
+    """The Hebrew month after (year, month)."""
+    nxt = Months(month).next_month(year)
+    return (year + 1 if nxt == Months.TISHREI else year), int(nxt)
+
+
+def month_length(year: int, month: int) -> int:
+    """Number of days in a Hebrew month."""
+    return Months(month).days(year)
+
+
+def actual_molad(gdate: date) -> str:
+    """Friendly molad text announced during the Hebrew month of gdate."""
+    year, month = next_hebrew_month(*hebrew_month_year(gdate))
+    day_num, hours, minutes, chalakim = molad_raw(year, civil_to_biblical_month(month))
+    civil_hours = hours - 6
+    if civil_hours < 0:
+        civil_hours += 24
+        day_num = day_num - 1 if day_num > 1 else 7
+    hours12 = civil_hours % 12 or 12
+    am_pm = "am" if civil_hours < 12 else "pm"
+    return f"{DAY_NAMES[day_num - 1]}, {hours12}:{minutes:02d} {am_pm} and {chalakim} chalakim"
+
+
+def rosh_chodesh(gdate: date) -> tuple[str, list[date]]:
+    """Name and Gregorian dates of the next Rosh Chodesh (none before Tishrei)."""
+    year, month = hebrew_month_year(gdate)
+    nxt_year, nxt_month = next_hebrew_month(year, month)
+    g_second = HebrewDate(nxt_year, nxt_month, 1).to_gdate()
+    name = HebrewDate.from_gdate(g_second).month.name
+    if nxt_month == 1:
+        return name, []
+    if month_length(year, month) == 30:
+        return name, [HebrewDate(year, month, 30).to_gdate(), g_second]
+    return name, [g_second]
+
+
+def shabbos_mevorchim_date(gdate: date) -> date:
+    """Shabbos Mevorchim of the Hebrew month of gdate."""
+    year, month = hebrew_month_year(gdate)
+    length = month_length(year, month)
+    last = HebrewDate(year, month, length).to_gdate()
+    days_back = (last.weekday() - 5) % 7
+    if days_back == 0 and length == 30:
+        days_back = 7
+    return last - timedelta(days=days_back)
+
+
+def location(latitude: float, longitude: float, time_zone: str, diaspora: bool) -> hdate.Location:
+    """An hdate location."""
+    return hdate.Location(latitude=latitude, longitude=longitude, timezone=time_zone, diaspora=diaspora)
+
+
+def shabbat_window(location: hdate.Location, friday: date) -> tuple[datetime | None, datetime | None]:
+    """Friday candle lighting and Saturday havdalah."""
+    saturday = friday + timedelta(days=1)
+    return hdate.Zmanim(date=friday, location=location).candle_lighting, hdate.Zmanim(date=saturday, location=location).havdalah
+
+
+def is_actual_shabbat(location: hdate.Location, now: datetime) -> bool:
+    """Check if now is between Friday candle lighting and Saturday havdalah."""
+    z = hdate.Zmanim(date=now.date(), location=location)
+    if now.weekday() == 5 and z.havdalah and now < z.havdalah:
+        return True
+    return now.weekday() == 4 and bool(z.candle_lighting) and now >= z.candle_lighting
+
+
+def is_shabbos_mevorchim(location: hdate.Location, now: datetime) -> bool:
+    """Check if now is Shabbos Mevorchim (never before Tishrei)."""
+    if not is_actual_shabbat(location, now):
+        return False
+    today = now.date()
+    h = HebrewDate.from_gdate(today if today.weekday() == 5 else today + timedelta(days=1))
+    target = HebrewDate.from_gdate(shabbos_mevorchim_date(today))
+    return h.day == target.day and int(h.month) != 14
@@ -1,40 +1,84 @@
-"""The Molad integration."""
+"""The Molad integration.
+
+Home Assistant is only imported when the integration is actually set up, so the
+calculation modules (and `python -m custom_components.molad`) work without it.
+"""
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import TYPE_CHECKING
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
+from .const import CONF_COLLECT_TIMINGS, DATA_CALCULATION_LOCK, DATA_CALENDAR_STORE, DATA_ENGINE, DOMAIN
 
-from .const import DOMAIN
-from .sensor import MoladDataUpdateCoordinator
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+# Platform values; homeassistant.const.Platform is a StrEnum of the same strings
+PLATFORMS: list[str] = ["calendar", "sensor"]
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Molad component."""
+    from .services import async_setup_services  # pylint: disable=import-outside-toplevel
+    from .websocket_api import async_setup_websocket_api  # pylint: disable=import-outside-toplevel
+
+    await async_setup_services(hass)
+    async_setup_websocket_api(hass)
     return True  # REQUIRED FOR CONFIG FLOW
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Molad from a config entry."""
-    coordinator = MoladDataUpdateCoordinator(hass, entry.data.get("diaspora", True))
-    await coordinator.async_config_entry_first_refresh()
+    from .coordinator import MoladDataUpdateCoordinator  # pylint: disable=import-outside-toplevel
+    from .helper import MoladEngine  # pylint: disable=import-outside-toplevel
+    from .storage import MoladCalendarStore  # pylint: disable=import-outside-toplevel
 
     hass.data.setdefault(DOMAIN, {})
+    # Location-independent results are computed once and shared by all entries
+    engine = hass.data[DOMAIN].get(DATA_ENGINE)
+    if engine is None:
+        engine = hass.data[DOMAIN][DATA_ENGINE] = MoladEngine()
+        hass.data[DOMAIN][DATA_CALENDAR_STORE] = MoladCalendarStore(hass, engine)
+        # Refreshes of all entries run one at a time under this lock
+        hass.data[DOMAIN][DATA_CALCULATION_LOCK] = asyncio.Lock()
+
+    coordinator = MoladDataUpdateCoordinator(
+        hass,
+        entry.data.get("diaspora", True),
+        engine,
+        hass.data[DOMAIN][DATA_CALENDAR_STORE],
+        hass.data[DOMAIN][DATA_CALCULATION_LOCK],
+        entry.options.get(CONF_COLLECT_TIMINGS, False),
+    )
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # The failed refresh scheduled a retry; HA retries the whole entry instead
+        await coordinator.async_shutdown()
+        raise
+
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        if hass.data[DOMAIN].keys() <= {DATA_ENGINE, DATA_CALENDAR_STORE, DATA_CALCULATION_LOCK}:
+            hass.data.pop(DOMAIN)
     return unload_ok
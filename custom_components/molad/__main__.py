@@ -0,0 +1,185 @@
+"""Export molad, Rosh Chodesh and Shabbos Mevorchim tables without Home Assistant.
+
+    python -m custom_components.molad --hebrew 5785 5790
+    python -m custom_components.molad --start 2025-01-01 --end 2030-12-31 --format jsonl
+    python -m custom_components.molad --hebrew 5785 5785 --latitude 40.7128 --longitude -74.006 \\
+        --timezone America/New_York
+
+One row per Hebrew month, written as it is calculated, so any range runs in
+constant memory. The molad time is in Jerusalem mean time (UTC+2:20:56). With a
+location, the molad in local time and Friday candle lighting and Saturday havdalah
+for Shabbos Mevorchim are added, limited to Friday and Saturday as the sensors
+limit them.
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterable, Iterator
+import csv
+from datetime import date, timedelta
+from itertools import islice
+import json
+import os
+import sys
+from typing import TextIO
+from zoneinfo import ZoneInfo
+
+from . import hebrew_calendar
+from .helper import MoladEngine, ScheduledMonth
+from .solar import Site, shabbat_interval, shabbat_windows
+
+FIELDS = [
+    "hebrew_year",
+    "month_name",
+    "first_day",
+    "molad_date",
+    "molad_time",
+    "molad_day",
+    "molad_hours",
+    "molad_minutes",
+    "molad_am_or_pm",
+    "molad_chalakim",
+    "molad",
+    "rosh_chodesh_dates",
+    "rosh_chodesh_days",
+    "shabbos_mevorchim",
+]
+LOCATION_FIELDS = ["molad_local_time", "shabbos_mevorchim_candle_lighting", "shabbos_mevorchim_havdalah"]
+
+# Months whose Shabbat times are calculated in one batch
+CHUNK_MONTHS = 120
+
+# Leave room for the month before and after the range within Python's date type
+MIN_DATE = date(1, 3, 1)
+MAX_DATE = date(9999, 10, 31)
+
+
+def months_in_range(engine: MoladEngine, first: date, last: date) -> Iterator[ScheduledMonth]:
+    """Hebrew months whose first day is in [first, last]."""
+    for month in engine.iter_months(first - timedelta(days=1)):
+        if month.first_day > last:
+            return
+        yield month
+
+
+def month_row(engine: MoladEngine, month: ScheduledMonth) -> dict:
+    """Flatten a month into one output row."""
+    m = month.molad
+    return {
+        "hebrew_year": month.hebrew_year,
+        "month_name": month.month_name,
+        "first_day": month.first_day.isoformat(),
+        "molad_date": month.molad_date.isoformat(),
+        "molad_time": m.jerusalem_time.isoformat(),
+        "molad_day": m.day,
+        "molad_hours": m.hours,
+        "molad_minutes": m.minutes,
+        "molad_am_or_pm": m.am_or_pm,
+        "molad_chalakim": m.chalakim,
+        "molad": m.friendly,
+        "rosh_chodesh_dates": ", ".join(d.isoformat() for d in month.rosh_chodesh),
+        "rosh_chodesh_days": ", ".join(engine._dow_name(d) for d in month.rosh_chodesh),
+        "shabbos_mevorchim": month.shabbos_mevorchim.isoformat() if month.shabbos_mevorchim else "",
+    }
+
+
+def location_rows(engine: MoladEngine, months: Iterable[ScheduledMonth], site: Site) -> Iterator[dict]:
+    """Month rows with Shabbos Mevorchim times, calculated CHUNK_MONTHS at a time."""
+    months = iter(months)
+    tz = ZoneInfo(site.time_zone)
+    while chunk := list(islice(months, CHUNK_MONTHS)):
+        fridays = [m.shabbos_mevorchim - timedelta(days=1) for m in chunk if m.shabbos_mevorchim]
+        windows = iter(shabbat_windows([site], fridays)[0])
+        for month in chunk:
+            row = month_row(engine, month)
+            window = next(windows) if month.shabbos_mevorchim else None
+            start = end = None
+            if window is not None:
+                # Clamped as the sensors clamp them; left blank where hdate has no time
+                friday = month.shabbos_mevorchim - timedelta(days=1)
+                start, end = shabbat_interval(friday, window, tz)
+                start, end = start if window.start else None, end if window.end else None
+            row["molad_local_time"] = month.molad.local_time(tz).isoformat()
+            row["shabbos_mevorchim_candle_lighting"] = start.isoformat() if start else ""
+            row["shabbos_mevorchim_havdalah"] = end.isoformat() if end else ""
+            yield row
+
+
+def write_rows(rows: Iterator[dict], fields: list[str], output_format: str, out: TextIO) -> int:
+    """Write rows as they are produced. Returns the number of rows written."""
+    count = 0
+    if output_format == "csv":
+        writer = csv.DictWriter(out, fieldnames=fields, lineterminator="\n")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            out.write(json.dumps(row))
+            out.write("\n")
+            count += 1
+    return count
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m custom_components.molad",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    span = parser.add_mutually_exclusive_group()
+    span.add_argument(
+        "--hebrew", nargs=2, type=int, metavar=("FIRST", "LAST"), help="Hebrew years, inclusive (e.g. 5785 5790)"
+    )
+    span.add_argument("--start", type=date.fromisoformat, help="first Gregorian date (default: today)")
+    parser.add_argument("--end", type=date.fromisoformat, help="last Gregorian date (default: a year after --start)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument("--output", type=argparse.FileType("w", encoding="utf-8"), default=sys.stdout)
+    parser.add_argument("--latitude", type=float)
+    parser.add_argument("--longitude", type=float)
+    parser.add_argument("--timezone", help="IANA time zone of the location, e.g. America/New_York")
+    parser.add_argument("--israel", dest="diaspora", action="store_false", help="location is in Israel")
+    args = parser.parse_args(argv)
+
+    location = (args.latitude, args.longitude, args.timezone)
+    if any(value is not None for value in location) and None in location:
+        parser.error("--latitude, --longitude and --timezone must be given together")
+    if args.hebrew is not None:
+        if args.end is not None:
+            parser.error("--end cannot be combined with --hebrew")
+        first = hebrew_calendar.rosh_hashana(args.hebrew[0])
+        last = hebrew_calendar.rosh_hashana(args.hebrew[1] + 1) - 1
+        if not MIN_DATE.toordinal() <= first <= last <= MAX_DATE.toordinal():
+            parser.error(f"Hebrew years must be in {MIN_DATE} to {MAX_DATE} and in order")
+        args.start, args.end = date.fromordinal(first), date.fromordinal(last)
+    else:
+        args.start = args.start or date.today()
+        args.end = args.end or date.fromordinal(min(args.start.toordinal() + 365, MAX_DATE.toordinal()))
+    if not MIN_DATE <= args.start <= args.end <= MAX_DATE:
+        parser.error(f"dates must be in {MIN_DATE} to {MAX_DATE} and in order")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    engine = MoladEngine()
+    months = months_in_range(engine, args.start, args.end)
+    if args.latitude is None:
+        fields = FIELDS
+        rows = (month_row(engine, month) for month in months)
+    else:
+        fields = FIELDS + LOCATION_FIELDS
+        rows = location_rows(engine, months, Site(args.latitude, args.longitude, args.timezone, args.diaspora))
+    try:
+        write_rows(rows, fields, args.format, args.output)
+        args.output.flush()
+    except BrokenPipeError:  # e.g. piped into head
+        # Python flushes stdout again at exit; point it at devnull so that doesn't fail too
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Calendar of molad, Rosh Chodesh and Shabbos Mevorchim dates."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import CALENDAR_MOLAD, DOMAIN
+from .events import MoladEvent, MoladEventIndex
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([MoladCalendar(coordinator)])
+
+
+def _to_calendar_event(event: MoladEvent) -> CalendarEvent:
+    return CalendarEvent(start=event.start, end=event.end, summary=event.summary, description=event.description)
+
+
+class MoladCalendar(CoordinatorEntity, CalendarEntity):
+    """Molad calendar."""
+
+    _attr_icon = "mdi:calendar-star"
+
+    # How far ahead the state looks for the next event (more than a Hebrew month)
+    LOOKAHEAD = timedelta(days=45)
+
+    def __init__(self, coordinator):
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{DOMAIN}_{CALENDAR_MOLAD}"
+        self._attr_name = "Molad"
+        self._index = MoladEventIndex(coordinator.helper.engine)
+        # Last event served, kept while the index is being built for a new day
+        self._event: CalendarEvent | None = None
+        self._building = False
+
+    async def async_added_to_hass(self) -> None:
+        """Build the index around today before the first state is written."""
+        today = dt_util.now().date()
+        await self.hass.async_add_executor_job(self._index.events, today, today + self.LOOKAHEAD)
+        await super().async_added_to_hass()
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next upcoming event.
+
+        Called in the event loop, so it only reads years the index has built; if
+        today's window needs another, that is built in the executor and the last
+        event is returned until it is done.
+        """
+        today = dt_util.now().date()
+        events = self._index.cached_events(today, today + self.LOOKAHEAD)
+        if events is None:
+            self._async_build(today)
+        else:
+            self._event = _to_calendar_event(events[0]) if events else None
+        return self._event
+
+    @callback
+    def _async_build(self, today: date) -> None:
+        if not self._building:
+            self._building = True
+            self.hass.async_create_task(self._async_build_and_write(today))
+
+    async def _async_build_and_write(self, today: date) -> None:
+        try:
+            await self.hass.async_add_executor_job(self._index.events, today, today + self.LOOKAHEAD)
+        finally:
+            self._building = False
+        self.async_write_ha_state()
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the events overlapping a time window."""
+        start = dt_util.as_local(start_date).date()
+        end_local = dt_util.as_local(end_date)
+        end = end_local.date()
+        if end_local.time() != datetime.min.time():
+            end += timedelta(days=1)
+
+        events = self._index.cached_events(start, end)
+        if events is None:
+            events = await hass.async_add_executor_job(self._index.events, start, end)
+        return [_to_calendar_event(event) for event in events]
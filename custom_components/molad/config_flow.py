@@ -4,8 +4,9 @@ from __future__ import annotations
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
 
-from .const import DOMAIN, DEFAULT_NAME, DEFAULT_DIASPORA
+from .const import CONF_COLLECT_TIMINGS, DOMAIN, DEFAULT_NAME, DEFAULT_DIASPORA
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -13,6 +14,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(self, user_input=None):
         """Handle a flow initialized by the user."""
         if user_input is not None:
@@ -29,3 +36,27 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 }
             ),
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Molad options flow."""
+
+    def __init__(self, config_entry):
+        """Initialize the options flow."""
+        self._options = dict(config_entry.options)
+
+    async def async_step_init(self, user_input=None):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_COLLECT_TIMINGS, default=self._options.get(CONF_COLLECT_TIMINGS, False)
+                    ): bool,
+                }
+            ),
+        )
@@ -6,8 +6,10 @@ DEFAULT_DIASPORA = True
 
 # Entity IDs
 SENSOR_MOLAD = "sensor.molad"
+SENSOR_MOLAD_TIME = "sensor.molad_time"
 SENSOR_IS_SHABBOS_MEVOCHIM = "sensor.is_shabbos_mevorchim"
 SENSOR_IS_UPCOMING_SHABBOS_MEVOCHIM = "sensor.is_upcoming_shabbos_mevorchim"
+CALENDAR_MOLAD = "calendar.molad"
 
 # Attributes
 ATTR_DAY = "day"
@@ -22,6 +24,31 @@ ATTR_ROSH_CHODESH_DATES = "rosh_chodesh_dates"
 ATTR_IS_SHABBOS_MEVOCHIM = "is_shabbos_mevorchim"
 ATTR_IS_UPCOMING_SHABBOS_MEVOCHIM = "is_upcoming_shabbos_mevorchim"
 ATTR_MONTH_NAME = "month_name"
+ATTR_MOLAD_TIME = "molad_time"
 
 # Defaults
 DEFAULT_DIASPORA = True
+
+# Options
+CONF_COLLECT_TIMINGS = "collect_timings"  # count calculation phases for diagnostics
+
+# hass.data keys
+DATA_ENGINE = "engine"  # shared MoladEngine, stored in hass.data[DOMAIN]
+DATA_CALENDAR_STORE = "calendar_store"  # shared MoladCalendarStore, stored in hass.data[DOMAIN]
+DATA_CALCULATION_LOCK = "calculation_lock"  # shared asyncio.Lock, stored in hass.data[DOMAIN]
+
+# Services
+SERVICE_GET_SCHEDULE = "get_schedule"
+ATTR_MONTHS = "months"
+ATTR_START_DATE = "start_date"
+DEFAULT_SCHEDULE_MONTHS = 12
+MAX_SCHEDULE_MONTHS = 1200
+
+SERVICE_PROFILE = "profile"
+ATTR_STEP = "step"
+ATTR_END_DATE = "end_date"
+ATTR_ITERATIONS = "iterations"
+ATTR_LIMIT = "limit"
+DEFAULT_PROFILE_DAYS = 31
+MAX_PROFILE_DAYS = 3660
+MAX_PROFILE_ITERATIONS = 100
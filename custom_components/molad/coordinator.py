@@ -0,0 +1,201 @@
+"""Data update coordinator for the Molad integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from datetime import date, datetime, timedelta
+import logging
+from time import perf_counter
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+from .helper import MoladDetails, MoladEngine, MoladHelper, prime_shabbat_windows
+from .storage import MoladCalendarStore
+from .timing import PhaseTimer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MoladDataUpdateCoordinator(DataUpdateCoordinator[MoladDetails]):
+    """Refresh molad data at the moments it can change instead of polling.
+
+    The outputs fall into groups that change at different times: the molad and
+    Rosh Chodesh once per Hebrew month, is_upcoming_shabbos_mevorchim once per
+    week and is_shabbos_mevorchim at candle lighting and havdalah. Each group is
+    kept with the window it is valid for; a refresh recomputes only the groups
+    whose window has passed, and the next refresh is when the first one expires.
+    The results are frozen dataclasses that compare by value, so with
+    always_update=False listeners are only called, and entity states only
+    written, when something actually changed.
+    """
+
+    RETRY_INTERVAL = timedelta(minutes=30)
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        diaspora: bool,
+        engine: MoladEngine | None = None,
+        calendar_store: MoladCalendarStore | None = None,
+        calculation_lock: asyncio.Lock | None = None,
+        collect_timings: bool = False,
+    ):
+        self.helper = MoladHelper(
+            hass.config.latitude, hass.config.longitude, str(hass.config.time_zone), diaspora, engine
+        )
+        self._calendar_store = calendar_store
+        self._unsub_transition: CALLBACK_TYPE | None = None
+        # Diagnostics; phase timings are collected when the option or debug logging is on
+        self.collect_timings = collect_timings
+        self.timer = PhaseTimer()
+        self.last_refresh: datetime | None = None
+        self.last_refresh_ms: float | None = None
+        self.next_refresh: datetime | None = None
+        # Output group -> (value, computed at, valid until)
+        self._outputs: dict[str, tuple[Any, datetime, datetime]] = {}
+        # Schedule shared by websocket subscribers: (from date, months, pending or done job)
+        self._schedule: tuple[date, int, asyncio.Future[list[dict]]] | None = None
+        # Called on shutdown, e.g. to end websocket subscriptions when the entry is unloaded
+        self._shutdown_callbacks: list[CALLBACK_TYPE] = []
+        # Shared by all entries (see async_setup_entry), so their refreshes run one at a time
+        self._calculation_lock = calculation_lock or asyncio.Lock()
+        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=None, always_update=False)
+
+    def _calculate(self, now: datetime, helpers: Sequence[MoladHelper]) -> tuple[MoladDetails, datetime]:
+        """Run the blocking calculation. Called from an executor thread, under the calculation lock."""
+        helper = self.helper
+        # Every entry is at the same location, so the first refresh of a week computes
+        # its Shabbat for all of them in one batch. The lock keeps the other entries'
+        # helpers from being used meanwhile.
+        friday = helper._week_saturday(helper._local(now).date()) - timedelta(days=1)
+        prime = prime_shabbat_windows if helper.timer is None else helper.timer.timed("zmanim", prime_shabbat_windows)
+        prime(helpers, [friday])
+        groups: dict[str, Callable[[], tuple[Any, datetime]]] = {
+            "month": lambda: (
+                (helper.get_actual_molad(now.date()), helper.get_rosh_chodesh_days(now.date())),
+                helper.month_valid_until(now),
+            ),
+            "week": lambda: (helper.is_upcoming_shabbos_mevorchim(now), helper.week_valid_until(now)),
+            "shabbat": lambda: (helper.is_shabbos_mevorchim(now), helper.shabbat_valid_until(now)),
+        }
+        # Only replaced once everything succeeded, so a failed refresh leaves no partial state
+        outputs = dict(self._outputs)
+        for name, compute in groups.items():
+            cached = outputs.get(name)
+            if cached is None or not cached[1] <= now < cached[2]:
+                value, until = compute()
+                outputs[name] = (value, now, until)
+        self._outputs = outputs
+
+        (molad, rosh_chodesh), shabbos_next, shabbos_now = (outputs[name][0] for name in groups)
+        details = MoladDetails(molad, shabbos_now, shabbos_next, rosh_chodesh)
+        return details, min(until for _, _, until in outputs.values())
+
+    async def _async_update_data(self) -> MoladDetails:
+        now = datetime.now(tz=self.helper.tz)
+        start = perf_counter()
+        try:
+            async with self._calculation_lock:
+                # Only for this calculation, inside the lock: the engine is shared by every
+                # entry and also used outside the lock (calendar, schedules)
+                self.helper.set_timer(self.timer if self.timing_enabled else None)
+                try:
+                    # The refresh phase counts what the others leave, so together they add up to the whole calculation
+                    calculate = self.timer.timed("refresh", self._calculate) if self.timing_enabled else self._calculate
+                    if self._calendar_store is not None:
+                        await self._calendar_store.async_ensure_year(now.date())
+                    helpers = [self.helper] + [
+                        coordinator.helper
+                        for coordinator in self.hass.data.get(DOMAIN, {}).values()
+                        if isinstance(coordinator, MoladDataUpdateCoordinator) and coordinator is not self
+                    ]
+                    details, next_transition = await self.hass.async_add_executor_job(calculate, now, helpers)
+                finally:
+                    self.helper.set_timer(None)
+        except Exception as err:
+            self._schedule_transition(now + self.RETRY_INTERVAL)
+            raise UpdateFailed(f"Error calculating molad: {err}") from err
+        finally:
+            self.last_refresh = now
+            self.last_refresh_ms = round((perf_counter() - start) * 1000, 3)
+
+        _LOGGER.debug("Molad refresh took %.1f ms", self.last_refresh_ms)
+        self._schedule_transition(next_transition)
+        return details
+
+    async def async_get_schedule(self, months: int) -> list[dict]:
+        """The schedule of the coming months, shared by every caller.
+
+        Computed in the executor once a day, for the most months asked for so far;
+        each caller gets a slice of it, and callers arriving while it is computed
+        wait for the same job.
+        """
+        today = datetime.now(tz=self.helper.tz).date()
+        cached = self._schedule
+        if cached is None or cached[0] != today or cached[1] < months:
+            count = max(months, cached[1]) if cached is not None and cached[0] == today else months
+            engine = self.helper.engine
+            job = self.hass.async_add_executor_job(lambda: list(engine.iter_schedule(today, count)))
+            cached = self._schedule = (today, count, job)
+        try:
+            # Shielded: one caller being cancelled must not cancel the job the others wait for
+            schedule = await asyncio.shield(cached[2])
+        except Exception:
+            if self._schedule is cached:
+                self._schedule = None
+            raise
+        return schedule[:months]
+
+    @property
+    def timing_enabled(self) -> bool:
+        """Whether refreshes count their phases in self.timer."""
+        return self.collect_timings or _LOGGER.isEnabledFor(logging.DEBUG)
+
+    @property
+    def valid_until(self) -> dict[str, datetime]:
+        """When each output group is next recomputed."""
+        return {name: until for name, (_, _, until) in self._outputs.items()}
+
+    def _schedule_transition(self, when: datetime) -> None:
+        """Schedule a single refresh at the next transition, replacing any pending one."""
+        self._cancel_transition()
+        _LOGGER.debug("Next molad refresh scheduled for %s", when)
+        self.next_refresh = when
+        self._unsub_transition = async_track_point_in_time(self.hass, self._async_handle_transition, when)
+
+    def _cancel_transition(self) -> None:
+        """Cancel the pending transition refresh, if any."""
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+            self._unsub_transition = None
+            self.next_refresh = None
+
+    async def _async_handle_transition(self, _now: datetime) -> None:
+        """Refresh when a scheduled transition is reached."""
+        self._unsub_transition = None
+        self.next_refresh = None
+        await self.async_refresh()
+
+    @callback
+    def async_on_shutdown(self, shutdown_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call shutdown_callback when the coordinator shuts down. Returns a function that cancels this."""
+        self._shutdown_callbacks.append(shutdown_callback)
+
+        @callback
+        def remove() -> None:
+            if shutdown_callback in self._shutdown_callbacks:
+                self._shutdown_callbacks.remove(shutdown_callback)
+
+        return remove
+
+    async def async_shutdown(self) -> None:
+        """Cancel the pending transition refresh and notify shutdown callbacks on unload."""
+        self._cancel_transition()
+        callbacks, self._shutdown_callbacks = self._shutdown_callbacks, []
+        for shutdown_callback in callbacks:
+            shutdown_callback()
+        await super().async_shutdown()
@@ -0,0 +1,90 @@
+"""Bounded LRU cache for Gregorian <-> Hebrew date conversions."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import date
+import threading
+from typing import NamedTuple
+
+from . import hebrew_calendar
+
+
+class SimpleHebrewDate(NamedTuple):
+    """A Hebrew date with hdate's CIVIL month numbering."""
+
+    year: int
+    month: int
+    day: int
+
+
+class HebrewDateCache:
+    """Memoize Hebrew date conversions with LRU eviction and hit/miss counters.
+
+    Gregorian dates are keyed by date, Hebrew dates by (year, month, day).
+    A Hebrew date that does not exist (e.g. the 30th of a 29-day month) is cached
+    as well, and raises ValueError on every lookup just like hdate does.
+    Conversions themselves use the integer engine in hebrew_calendar.
+    """
+
+    DEFAULT_MAXSIZE = 512
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, SimpleHebrewDate | date | ValueError] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hebrew_from_gdate(self, gdate: date) -> SimpleHebrewDate:
+        """Get the Hebrew date for a Gregorian date."""
+        return self._lookup(
+            ("g", gdate), lambda: SimpleHebrewDate(*hebrew_calendar.from_ordinal(gdate.toordinal()))
+        )
+
+    def gdate_from_hebrew(self, year: int, month: int, day: int) -> date:
+        """Get the Gregorian date for a Hebrew date. Raises ValueError if it does not exist."""
+        return self._lookup(("h", year, month, day), lambda: self._to_gdate(year, month, day))
+
+    @staticmethod
+    def _to_gdate(year: int, month: int, day: int) -> date | ValueError:
+        if not hebrew_calendar.is_valid_date(year, month, day):
+            return ValueError(f"Hebrew date {year}-{month}-{day} does not exist")
+        return date.fromordinal(hebrew_calendar.to_ordinal(year, month, day))
+
+    def _lookup(self, key: tuple, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                value = self._entries[key]
+            else:
+                self.misses += 1
+                value = compute()
+                self._entries[key] = value
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+        if isinstance(value, ValueError):
+            raise ValueError(*value.args)
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return cache size and counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,37 @@
+"""Diagnostics support for the Molad integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import MoladDataUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Phase timings are only collected while the collect_timings option or debug
+    logging is enabled for the integration; timing_enabled says whether, so empty
+    timings are not mistaken for no time spent.
+    """
+    coordinator: MoladDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    engine = coordinator.helper.engine
+    span = engine.year_table_span()
+
+    return {
+        "entry": {"diaspora": coordinator.helper.diaspora, "time_zone": coordinator.helper.time_zone},
+        "refresh": {
+            "last_update_success": coordinator.last_update_success,
+            "last_refresh": coordinator.last_refresh.isoformat() if coordinator.last_refresh else None,
+            "last_refresh_ms": coordinator.last_refresh_ms,
+            "next_refresh": coordinator.next_refresh.isoformat() if coordinator.next_refresh else None,
+            "valid_until": {name: until.isoformat() for name, until in coordinator.valid_until.items()},
+        },
+        "timing_enabled": coordinator.timing_enabled,
+        "timings": coordinator.timer.stats(),
+        "caches": engine.cache_stats(),
+        "year_table": None if span is None else {"start": span[0].isoformat(), "end": span[1].isoformat()},
+    }
@@ -0,0 +1,143 @@
+"""Per-Hebrew-year index of molad, Rosh Chodesh and Shabbos Mevorchim events, built on demand."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+import threading
+
+from . import hebrew_calendar
+from .helper import MoladEngine, ScheduledMonth
+
+
+@dataclass(frozen=True, slots=True)
+class MoladEvent:
+    """An all-day event; end is exclusive."""
+
+    start: date
+    end: date
+    summary: str
+    description: str
+
+
+def month_title(month_name: str) -> str:
+    """Format a month name for display, e.g. ADAR_I -> Adar I."""
+    return month_name.replace("_", " ").title()
+
+
+def month_events(month: ScheduledMonth) -> list[MoladEvent]:
+    """The events announced for one Hebrew month, sorted by start."""
+    title = month_title(month.month_name)
+    events = [
+        MoladEvent(
+            month.molad_date, month.molad_date + timedelta(days=1), f"Molad {title}", month.molad.friendly
+        )
+    ]
+    if month.rosh_chodesh:
+        days = " & ".join(MoladEngine._dow_name(d) for d in month.rosh_chodesh)
+        events.append(
+            MoladEvent(
+                month.rosh_chodesh[0],
+                month.rosh_chodesh[-1] + timedelta(days=1),
+                f"Rosh Chodesh {title}",
+                days,
+            )
+        )
+    if month.shabbos_mevorchim is not None:
+        events.append(
+            MoladEvent(
+                month.shabbos_mevorchim,
+                month.shabbos_mevorchim + timedelta(days=1),
+                f"Shabbos Mevorchim {title}",
+                f"Molad: {month.molad.friendly}",
+            )
+        )
+    events.sort(key=lambda e: e.start)
+    return events
+
+
+class MoladEventIndex:
+    """Answer date-range queries from per-Hebrew-year event lists built on demand.
+
+    Each Hebrew year's events are kept as an independent chunk, sorted by start,
+    so a query only builds the years it touches however far apart they are. All
+    events of a month fall within 9 days before and 5 days after its first day,
+    so a window [start, end) needs the years from the one containing start - MARGIN
+    to the one containing end + MARGIN, and is answered by bisecting each of them.
+    The MAX_YEARS most recently used chunks are kept; a query needing more is
+    answered in full without keeping the excess.
+    """
+
+    MARGIN = 14
+    MAX_EVENT_DAYS = 2  # two-day Rosh Chodesh
+    MAX_YEARS = 64
+
+    def __init__(self, engine: MoladEngine):
+        self._engine = engine
+        self._lock = threading.Lock()
+        # Hebrew year -> (event start ordinals, events), least recently used first
+        self._chunks: OrderedDict[int, tuple[list[int], list[MoladEvent]]] = OrderedDict()
+
+    def _years(self, start: date, end: date) -> range:
+        first = hebrew_calendar.from_ordinal(start.toordinal() - self.MARGIN)[0]
+        last = hebrew_calendar.from_ordinal(end.toordinal() + self.MARGIN)[0]
+        return range(first, last + 1)
+
+    def cached_events(self, start: date, end: date) -> list[MoladEvent] | None:
+        """All events overlapping [start, end), or None if that needs a year not built yet."""
+        years = self._years(start, end)
+        with self._lock:
+            chunks = [self._chunks.get(year) for year in years]
+            if None in chunks:
+                return None
+            for year in years:
+                self._chunks.move_to_end(year)
+        return self._select(chunks, start, end)
+
+    def events(self, start: date, end: date) -> list[MoladEvent]:
+        """All events overlapping [start, end), building the years that are missing."""
+        years = self._years(start, end)
+        with self._lock:
+            chunks = {year: self._chunks.get(year) for year in years}
+        # Built outside the lock, so readers of the years already built never wait
+        for year, chunk in chunks.items():
+            if chunk is None:
+                chunks[year] = self._build(year)
+        with self._lock:
+            for year in years[-self.MAX_YEARS :]:
+                self._chunks[year] = self._chunks.get(year) or chunks[year]
+                self._chunks.move_to_end(year)
+            while len(self._chunks) > self.MAX_YEARS:
+                self._chunks.popitem(last=False)
+        return self._select(chunks.values(), start, end)
+
+    def _select(
+        self, chunks: Iterable[tuple[list[int], list[MoladEvent]]], start: date, end: date
+    ) -> list[MoladEvent]:
+        a, b = start.toordinal(), end.toordinal()
+        selected: list[MoladEvent] = []
+        for starts, events in chunks:
+            lo = bisect_left(starts, a - self.MAX_EVENT_DAYS + 1)
+            hi = bisect_left(starts, b)
+            selected.extend(event for event in events[lo:hi] if event.end > start)
+        # Neighbouring years' events can interleave around Rosh Hashana
+        selected.sort(key=lambda e: e.start)
+        return selected
+
+    def _build(self, year: int) -> tuple[list[int], list[MoladEvent]]:
+        """The events of the months of one Hebrew year, sorted by start."""
+        events: list[MoladEvent] = []
+        # Starting the day before Rosh Hashana yields Tishrei first
+        after = max(hebrew_calendar.rosh_hashana(year) - 1, 1)
+        try:
+            for month in self._engine.iter_months(date.fromordinal(after)):
+                if month.hebrew_year > year:
+                    break
+                if month.hebrew_year == year:
+                    events.extend(month_events(month))
+        except (ValueError, OverflowError):
+            pass  # the rest of the year is outside the range of datetime.date
+        events.sort(key=lambda e: e.start)
+        return [event.start.toordinal() for event in events], events
@@ -0,0 +1,165 @@
+"""Pure-integer Hebrew calendar arithmetic.
+
+Rosh Hashana (with the dehiyyot), year and month lengths and Gregorian <-> Hebrew
+conversion, all derived from the same molad arithmetic as MoladEngine._molad_raw.
+Dates are Gregorian ordinals (date.toordinal()) and months use hdate's CIVIL
+numbering (Tishrei=1 ... Adar=6, Adar I=7, Adar II=8, Nisan=9 ... Elul=14).
+Nothing here raises for out-of-range input; use is_valid_date to check a date.
+"""
+from __future__ import annotations
+
+CHALAKIM_PER_HOUR = 1080
+CHALAKIM_PER_DAY = 24 * CHALAKIM_PER_HOUR
+CHALAKIM_PER_WEEK = 7 * CHALAKIM_PER_DAY
+LUNAR_MONTH_CHALAKIM = 29 * CHALAKIM_PER_DAY + 12 * CHALAKIM_PER_HOUR + 793
+
+# Molad Tishrei of year 1 (BaHaRaD: Monday 5h 204p), counted from the start of
+# the Hebrew Sunday of that week (Saturday 6pm)
+MOLAD_EPOCH_CHALAKIM = 1 * CHALAKIM_PER_DAY + 5 * CHALAKIM_PER_HOUR + 204
+# Gregorian ordinal of that Sunday (October 6, 3761 BCE Julian)
+EPOCH_SUNDAY_ORDINAL = -1373428
+
+MONTH_NAMES = (
+    "",
+    "TISHREI",
+    "MARCHESHVAN",
+    "KISLEV",
+    "TEVET",
+    "SHVAT",
+    "ADAR",
+    "ADAR_I",
+    "ADAR_II",
+    "NISAN",
+    "IYYAR",
+    "SIVAN",
+    "TAMMUZ",
+    "AV",
+    "ELUL",
+)
+
+COMMON_YEAR_MONTHS = (1, 2, 3, 4, 5, 6, 9, 10, 11, 12, 13, 14)
+LEAP_YEAR_MONTHS = (1, 2, 3, 4, 5, 7, 8, 9, 10, 11, 12, 13, 14)
+
+# Fixed month lengths by month number; Cheshvan (2) and Kislev (3) depend on the year
+_FIXED_LENGTHS = (0, 30, 0, 0, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29)
+
+# Yom Tov days as (month, day): Rosh Hashana, Yom Kippur, the first and last days
+# of Sukkot (Shemini Atzeret) and Pesach, and Shavuot. The diaspora adds a second day.
+YOM_TOV_ISRAEL = frozenset({(1, 1), (1, 2), (1, 10), (1, 15), (1, 22), (9, 15), (9, 21), (11, 6)})
+YOM_TOV_DIASPORA = YOM_TOV_ISRAEL | {(1, 16), (1, 23), (9, 16), (9, 22), (11, 7)}
+
+
+def is_leap_year(year: int) -> bool:
+    """Check if a Hebrew year has 13 months (years 3, 6, 8, 11, 14, 17, 19 of the cycle)."""
+    return (7 * year + 1) % 19 < 7
+
+
+def is_yom_tov(month: int, day: int, diaspora: bool) -> bool:
+    """Check if a Hebrew date is a Yom Tov (same days as hdate's YOM_TOV holidays)."""
+    return (month, day) in (YOM_TOV_DIASPORA if diaspora else YOM_TOV_ISRAEL)
+
+
+def months_before_year(year: int) -> int:
+    """Lunar months from Tishrei of year 1 to Tishrei of year."""
+    return (235 * (year - 1) + 1) // 19
+
+
+def molad_chalakim(year: int, month: int) -> int:
+    """Absolute molad of a Hebrew month (BIBLICAL numbering, Tishrei=7, Adar II=13),
+    in chalakim from the start of the epoch week. Same arithmetic as _molad_raw
+    without the reduction modulo a week.
+    """
+    if month >= 7:
+        offset = month - 7
+    else:
+        offset = (7 if is_leap_year(year) else 6) + month - 1
+    return (months_before_year(year) + offset) * LUNAR_MONTH_CHALAKIM + MOLAD_EPOCH_CHALAKIM
+
+
+def _rosh_hashana_day(year: int) -> int:
+    """Day index of Rosh Hashana, counted from the epoch Sunday."""
+    molad = molad_chalakim(year, 7)
+    day, parts = divmod(molad, CHALAKIM_PER_DAY)
+    weekday = day % 7  # 0 = Sunday
+
+    if parts >= 18 * CHALAKIM_PER_HOUR:  # Molad zaken
+        day += 1
+    elif weekday == 2 and parts >= 9 * CHALAKIM_PER_HOUR + 204 and not is_leap_year(year):  # GaTaRaD
+        day += 2
+    elif weekday == 1 and parts >= 15 * CHALAKIM_PER_HOUR + 589 and is_leap_year(year - 1):  # BeTUTaKPaT
+        day += 1
+
+    if day % 7 in (0, 3, 5):  # Lo ADU Rosh: never Sunday, Wednesday or Friday
+        day += 1
+    return day
+
+
+def rosh_hashana(year: int) -> int:
+    """Gregorian ordinal of 1 Tishrei of a Hebrew year."""
+    return _rosh_hashana_day(year) + EPOCH_SUNDAY_ORDINAL
+
+
+def year_length(year: int) -> int:
+    """Number of days in a Hebrew year (353-355 or 383-385)."""
+    return _rosh_hashana_day(year + 1) - _rosh_hashana_day(year)
+
+
+def months_in_year(year: int) -> tuple[int, ...]:
+    """The months of a Hebrew year in calendar order."""
+    return LEAP_YEAR_MONTHS if is_leap_year(year) else COMMON_YEAR_MONTHS
+
+
+def month_length(year: int, month: int, length_of_year: int | None = None) -> int:
+    """Number of days (29 or 30) in a Hebrew month. Pass length_of_year if already known."""
+    if month == 2 or month == 3:
+        if length_of_year is None:
+            length_of_year = year_length(year)
+        if month == 2:
+            return 30 if length_of_year % 10 == 5 else 29
+        return 29 if length_of_year % 10 == 3 else 30
+    return _FIXED_LENGTHS[month]
+
+
+def month_start(year: int, month: int) -> int:
+    """Gregorian ordinal of day 1 of a Hebrew month."""
+    ordinal = rosh_hashana(year)
+    length_of_year = year_length(year)
+    for m in months_in_year(year):
+        if m == month:
+            break
+        ordinal += month_length(year, m, length_of_year)
+    return ordinal
+
+
+def is_valid_date(year: int, month: int, day: int) -> bool:
+    """Check that the month exists in the year and the day in the month."""
+    return month in months_in_year(year) and 1 <= day <= month_length(year, month)
+
+
+def to_ordinal(year: int, month: int, day: int) -> int:
+    """Gregorian ordinal of a Hebrew date. The date is not validated."""
+    return month_start(year, month) + day - 1
+
+
+def from_ordinal(ordinal: int) -> tuple[int, int, int]:
+    """Hebrew (year, month, day) of a Gregorian ordinal."""
+    # Mean year is 365.2468 days; the estimate is off by at most one year
+    year = (ordinal - EPOCH_SUNDAY_ORDINAL) * 10000 // 3652468 + 1
+    start = rosh_hashana(year)
+    if start > ordinal:
+        year -= 1
+        start = rosh_hashana(year)
+    else:
+        following = rosh_hashana(year + 1)
+        if following <= ordinal:
+            year += 1
+            start = following
+
+    length_of_year = year_length(year)
+    remaining = ordinal - start
+    for month in months_in_year(year):
+        length = month_length(year, month, length_of_year)
+        if remaining < length:
+            return year, month, remaining + 1
+        remaining -= length
+    raise AssertionError("unreachable: ordinal past the end of its Hebrew year")
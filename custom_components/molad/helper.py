@@ -0,0 +1,807 @@
+"""Molad, Rosh Chodesh and Shabbos Mevorchim calculations.
+
+Everything in this module is pure calculation with no Home Assistant dependency,
+so it is safe to run in an executor thread. Shabbat times come from the batched
+solar calculations in solar.py.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from itertools import repeat
+import threading
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+from . import hebrew_calendar
+from .date_cache import HebrewDateCache, SimpleHebrewDate
+from .month_index import MonthIndex
+from .solar import ShabbatWindow, Site, shabbat_interval, shabbat_windows
+from .timing import PhaseTimer, TimedMethods
+
+# The molad is reckoned in Jerusalem mean solar time: 35.2354 degrees east of
+# Greenwich is 2h 20m 56s ahead of UTC, with no daylight saving.
+MOLAD_TIME_ZONE = timezone(timedelta(hours=2, minutes=20, seconds=56), "Jerusalem mean time")
+
+
+def molad_datetime(absolute_chalakim: int) -> datetime:
+    """The moment of a molad given in chalakim from the start of the epoch week
+    (hebrew_calendar.molad_chalakim), in MOLAD_TIME_ZONE.
+    """
+    day, parts = divmod(absolute_chalakim, hebrew_calendar.CHALAKIM_PER_DAY)
+    # Hebrew day `day` of the epoch week starts at 6pm on the civil day before
+    start = datetime.combine(
+        date.fromordinal(hebrew_calendar.EPOCH_SUNDAY_ORDINAL + day - 1), time(18), tzinfo=MOLAD_TIME_ZONE
+    )
+    # One chelek is 3 1/3 seconds
+    return start + timedelta(microseconds=parts * 10_000_000 // 3)
+
+
+@dataclass(frozen=True, slots=True)
+class Molad:
+    day: str
+    hours: int
+    minutes: int
+    am_or_pm: str
+    chalakim: int
+    friendly: str
+    absolute_chalakim: int  # from the start of the epoch week, see hebrew_calendar.molad_chalakim
+
+    @property
+    def jerusalem_time(self) -> datetime:
+        """The moment of the molad in Jerusalem mean time."""
+        return molad_datetime(self.absolute_chalakim)
+
+    def local_time(self, tz: tzinfo) -> datetime:
+        """The moment of the molad in another time zone."""
+        return self.jerusalem_time.astimezone(tz)
+
+
+@dataclass(frozen=True, slots=True)
+class RoshChodesh:
+    month: str
+    text: str
+    days: tuple[str, ...]
+    gdays: tuple[date, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class MoladDetails:
+    molad: Molad
+    is_shabbos_mevorchim: bool
+    is_upcoming_shabbos_mevorchim: bool
+    rosh_chodesh: RoshChodesh
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledMonth:
+    """One Hebrew month with the dates announced for it (see MoladEngine.iter_months)."""
+
+    hebrew_year: int
+    month: int  # CIVIL numbering
+    month_name: str
+    first_day: date  # 1st of the month (the last day of Rosh Chodesh)
+    molad: Molad
+    molad_date: date  # civil date of the molad, in Jerusalem
+    rosh_chodesh: tuple[date, ...]  # empty for Tishrei
+    shabbos_mevorchim: date | None  # None for Tishrei
+
+
+class _ShabbatWeek(NamedTuple):
+    """One week's Shabbat for a site as the interval [start, end) (see MoladHelper._add_week)."""
+
+    window: ShabbatWindow
+    start: datetime
+    end: datetime
+    mevorchim: bool
+
+
+class _YearTable(NamedTuple):
+    """Lookup index over a precomputed Hebrew year (see MoladEngine.build_year_table)."""
+
+    year: int
+    starts: list[date]  # first Gregorian day of each month, ascending
+    keys: list[tuple[int, int]]  # (year, month) for each start
+    end: date  # first day of the following year
+    results: dict[tuple[int, int], tuple[Molad, RoshChodesh, date]]
+
+
+class MoladEngine(TimedMethods):
+    """Location-independent calculations: molad, Hebrew month boundaries and Rosh Chodesh.
+    
+    Results depend only on the Hebrew month, so they are memoized per month and one
+    engine can be shared by every config entry.
+    """
+
+    # === CONSTANTS ===
+    CHALAKIM_PER_HOUR = 1080
+    CHALAKIM_PER_DAY = 24 * CHALAKIM_PER_HOUR
+    CHALAKIM_PER_WEEK = 7 * CHALAKIM_PER_DAY
+    LUNAR_MONTH_CHALAKIM = 29 * CHALAKIM_PER_DAY + 12 * CHALAKIM_PER_HOUR + 793  # 765433
+
+    # Reference: Molad Tishrei, Year 1 = Monday 5h 204p (Hebrew time)
+    # Hebrew time: Day 2 (Monday), Hour 5 (5 hours after 6pm Sunday)
+    # Civil time: Sunday 11:11:20 PM
+    REF_YEAR = 1
+    REF_MONTH = 7  # Tishrei (BIBLICAL numbering)
+    REF_DAY_OF_WEEK = 2  # Monday (Hebrew day, where Monday starts Sunday 6pm)
+    REF_HOURS = 5  # Hebrew hours (hours after 6pm)
+    REF_CHALAKIM = 204
+
+    # Leap years in 19-year cycle: years 3,6,8,11,14,17,19
+    LEAP_YEARS_IN_CYCLE = {3, 6, 8, 11, 14, 17, 19}
+
+    # Hebrew months memoized per engine (a few years' worth)
+    MONTH_CACHE_SIZE = 64
+
+    # Hebrew years covered by the month index by default (1839-2440)
+    MONTH_INDEX_YEARS = (5600, 6200)
+
+    # The Gregorian <-> Hebrew conversions, whichever of the month index, the year
+    # table or the date cache answers them (see TimedMethods)
+    TIMED_PHASES = {
+        "_hebrew_month_year": "hebrew_date_conversion",
+        "hebrew_date": "hebrew_date_conversion",
+        "next_month_start": "hebrew_date_conversion",
+        "_gdate_from_hebrew": "hebrew_date_conversion",
+    }
+
+    def __init__(
+        self,
+        date_cache: HebrewDateCache | None = None,
+        index_years: tuple[int, int] | None = MONTH_INDEX_YEARS,
+    ):
+        # Month boundaries within index_years come from a MonthIndex, built on first
+        # use; other Gregorian <-> Hebrew conversions go through this cache
+        self.dates = date_cache or HebrewDateCache()
+        self._index_years = index_years
+        self._index: MonthIndex | None = None
+        self._index_lock = threading.Lock()
+        self._molad_for_month = lru_cache(maxsize=self.MONTH_CACHE_SIZE)(self._molad_for_month)
+        self._rosh_chodesh_for_month = lru_cache(maxsize=self.MONTH_CACHE_SIZE)(self._rosh_chodesh_for_month)
+        self._shabbos_mevorchim_for_month = lru_cache(maxsize=self.MONTH_CACHE_SIZE)(
+            self._shabbos_mevorchim_for_month
+        )
+        # Swapped as a whole so readers never see a half-loaded table
+        self._year_table: _YearTable | None = None
+
+    # === MONTH NUMBERING CONVERSION ===
+    @staticmethod
+    def _civil_to_biblical_month(civil_month: int, is_leap: bool = False) -> int:
+        """Convert hdate's CIVIL month numbering to BIBLICAL numbering used by _molad_raw.
+
+        CIVIL (hdate.Months values): Tishrei=1, Cheshvan=2, ..., Shevat=5, Adar=6,
+            Adar I=7, Adar II=8, Nisan=9, Iyar=10, ..., Elul=14
+        BIBLICAL: Nisan=1, Iyar=2, ..., Elul=6, Tishrei=7, ..., Adar/Adar I=12, Adar II=13
+
+        Adar II maps to 13 so that _molad_raw counts it as the 7th month after Tishrei.
+        """
+        if civil_month <= 6:
+            # Tishrei(1)→7, Cheshvan(2)→8, Kislev(3)→9, Tevet(4)→10, Shevat(5)→11, Adar(6)→12
+            return civil_month + 6
+        elif civil_month == 7:
+            # Adar I in leap year → 12
+            return 12
+        elif civil_month == 8:
+            # Adar II in leap year → 13
+            return 13
+        else:
+            # Nisan(9)→1, Iyar(10)→2, Sivan(11)→3, Tammuz(12)→4, Av(13)→5, Elul(14)→6
+            return civil_month - 8
+
+    # === LEAP YEAR (FIXED) ===
+    @staticmethod
+    def _is_leap_year(year: int) -> bool:
+        """Check if a Hebrew year is a leap year.
+
+        Fixed: Year 19 (and 38, 57, etc.) are leap years.
+        The issue was that 19 % 19 = 0, not 19.
+        """
+        position = year % 19
+        if position == 0:
+            position = 19  # Year 19 of cycle, not year 0
+        return position in MoladEngine.LEAP_YEARS_IN_CYCLE
+
+    # === MOLAD WITH LEAP YEARS (CORRECT) ===
+    def _molad_raw(self, year: int, month: int) -> tuple[int, int, int, int]:
+        """Calculate molad using full Metonic cycle (235 months per 19 years).
+
+        IMPORTANT: Expects month in BIBLICAL numbering (Tishrei=7, not 1).
+        Use _civil_to_biblical_month() to convert from hdate's civil numbering.
+
+        Returns tuple of (day, hours_hebrew, minutes, chalakim) where hours are in Hebrew time.
+        """
+        years_from_ref = year - self.REF_YEAR  # e.g., year 5785 → 5784 years
+
+        # Complete 19-year cycles
+        complete_cycles = years_from_ref // 19
+        total_months = complete_cycles * 235  # 19 years = 235 months
+
+        # Remaining years in partial cycle
+        remaining_years = years_from_ref % 19
+        for y in range(1, remaining_years + 1):
+            cycle_year = y
+            total_months += 13 if cycle_year in self.LEAP_YEARS_IN_CYCLE else 12
+
+        # Add months in current year up to target month
+        # Hebrew year starts at Tishrei (month 7 in BIBLICAL system)
+        if month >= 7:
+            # Tishrei to target month
+            total_months += (month - 7)  # Tishrei = 0 extra
+        else:
+            # Nisan to target month
+            months_from_tishrei = 6  # Tishrei to Adar I
+            if self._is_leap_year(year):
+                months_from_tishrei = 7  # Tishrei to Adar II
+            total_months += months_from_tishrei + (month - 1)  # Nisan = month 1
+
+        # Total chalakim
+        total_chalakim = total_months * self.LUNAR_MONTH_CHALAKIM
+        total_chalakim += (self.REF_DAY_OF_WEEK - 1) * self.CHALAKIM_PER_DAY
+        total_chalakim += self.REF_HOURS * self.CHALAKIM_PER_HOUR
+        total_chalakim += self.REF_CHALAKIM
+        return self._split_chalakim(total_chalakim)
+
+    @classmethod
+    def _split_chalakim(cls, total_chalakim: int) -> tuple[int, int, int, int]:
+        """Split a molad in chalakim into (day, hours_hebrew, minutes, chalakim) within its week."""
+        total_chalakim %= cls.CHALAKIM_PER_WEEK
+
+        # Extract (returns Hebrew time)
+        days = total_chalakim // cls.CHALAKIM_PER_DAY + 1
+        remainder = total_chalakim % cls.CHALAKIM_PER_DAY
+        hours = remainder // cls.CHALAKIM_PER_HOUR
+        remainder %= cls.CHALAKIM_PER_HOUR
+        minutes = remainder // 18
+        chalakim = remainder % 18
+
+        return days, hours, minutes, chalakim
+
+    # === BATCH MOLAD ===
+    def molad_raw_batch(
+        self, years: Sequence[int], months: Sequence[int], civil: bool = False
+    ) -> tuple[list[int], list[int], list[int], list[int]]:
+        """Calculate many molads in one pass.
+
+        Takes parallel sequences of years and months and returns parallel lists of
+        (days, hours_hebrew, minutes, chalakim), matching _molad_raw element by element.
+        Months are in BIBLICAL numbering unless civil=True, in which case they are
+        hdate's CIVIL numbering and are converted with _civil_to_biblical_month().
+
+        The 19-year cycle loop in _molad_raw is replaced by its closed form
+        (235 * years + 1) // 19, so every element is a fixed number of integer operations.
+        """
+        if len(years) != len(months):
+            raise ValueError("years and months must have the same length")
+        if civil:
+            months = [self._civil_to_biblical_month(m) for m in months]
+
+        base = (
+            (self.REF_DAY_OF_WEEK - 1) * self.CHALAKIM_PER_DAY
+            + self.REF_HOURS * self.CHALAKIM_PER_HOUR
+            + self.REF_CHALAKIM
+        )
+        totals = [
+            (
+                (
+                    (235 * (y - self.REF_YEAR) + 1) // 19
+                    + (m - 7 if m >= 7 else (7 if (7 * y + 1) % 19 < 7 else 6) + m - 1)
+                )
+                * self.LUNAR_MONTH_CHALAKIM
+                + base
+            )
+            % self.CHALAKIM_PER_WEEK
+            for y, m in zip(years, months)
+        ]
+
+        days = [t // self.CHALAKIM_PER_DAY + 1 for t in totals]
+        parts = [t % self.CHALAKIM_PER_DAY % self.CHALAKIM_PER_HOUR for t in totals]
+        hours = [t % self.CHALAKIM_PER_DAY // self.CHALAKIM_PER_HOUR for t in totals]
+        minutes = [p // 18 for p in parts]
+        chalakim = [p % 18 for p in parts]
+
+        return days, hours, minutes, chalakim
+
+    def _molad_from_chalakim(self, absolute_chalakim: int) -> Molad:
+        """Build the Molad for an absolute molad (hebrew_calendar.molad_chalakim)."""
+        return self._raw_to_molad(self._split_chalakim(absolute_chalakim), absolute_chalakim)
+
+    def _raw_to_molad(self, raw: tuple[int, int, int, int], absolute_chalakim: int) -> Molad:
+        """Convert raw molad to Molad object.
+
+        Fixed: Now converts Hebrew hours to civil hours for traditional announcements.
+        Hebrew time starts at 6pm, so we subtract 6 hours to get civil time.
+        """
+        day_num, hours_hebrew, minutes, chalakim = raw
+        days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Shabbos"]
+
+        # Convert from Hebrew hours (starting at 6pm) to civil hours (starting at midnight)
+        # Hebrew hour 0 = 6pm civil (18:00)
+        # Hebrew hour 5 = 11pm civil (23:00)
+        # Hebrew hour 18 = noon civil (12:00)
+        civil_hours = hours_hebrew - 6
+        if civil_hours < 0:
+            civil_hours += 24
+            # Going back before midnight means previous civil day
+            day_num = day_num - 1 if day_num > 1 else 7
+
+        day_name = days[day_num - 1]
+        am_pm = "am" if civil_hours < 12 else "pm"
+        hours12 = civil_hours % 12
+        hours12 = 12 if hours12 == 0 else hours12
+
+        filler = "0" if minutes < 10 else ""
+        friendly = f"{day_name}, {hours12}:{filler}{minutes} {am_pm} and {chalakim} chalakim"
+
+        return Molad(day_name, hours12, minutes, am_pm, chalakim, friendly, absolute_chalakim)
+
+    def get_actual_molad(self, gdate: datetime.date) -> Molad:
+        """Get molad for the NEXT month (upcoming Rosh Chodesh).
+
+        Traditional practice announces the molad for the upcoming month,
+        not the current month.
+        """
+        cur = self._hebrew_month_year(gdate)
+        precomputed = self._precomputed(cur)
+        if precomputed is not None:
+            return precomputed[0]
+        return self._molad_for_month(cur["year"], cur["month"])
+
+    def _molad_for_month(self, year: int, month: int) -> Molad:
+        """Get the molad announced during the given Hebrew month (CIVIL numbering)."""
+        nxt = self._next_hebrew_month({"year": year, "month": month})
+
+        # Convert from civil to biblical month numbering!
+        # hdate returns: Tishrei=1, Cheshvan=2, Kislev=3, etc. (CIVIL)
+        # molad_chalakim expects: Tishrei=7, Cheshvan=8, Kislev=9, etc. (BIBLICAL)
+        is_leap = self._is_leap_year(nxt["year"])
+        biblical_month = self._civil_to_biblical_month(nxt["month"], is_leap)
+
+        return self._molad_from_chalakim(hebrew_calendar.molad_chalakim(nxt["year"], biblical_month))
+
+    # === HELPERS ===
+    def _hebrew_month_year(self, gdate: datetime.date) -> dict:
+        """Get Hebrew month and year from Gregorian date.
+        Note: Returns CIVIL month numbering from hdate library."""
+        table = self._year_table
+        if table is not None and table.starts[0] <= gdate < table.end:
+            year, month = table.keys[bisect_right(table.starts, gdate) - 1]
+            return {"year": year, "month": month}
+        index = self._month_index()
+        if index is not None and index.covers(ordinal := gdate.toordinal()):
+            i = index.position(ordinal)
+            return {"year": index.years[i], "month": index.months[i]}
+        h = self.dates.hebrew_from_gdate(gdate)
+        return {"year": h.year, "month": h.month}
+
+    def _month_index(self) -> MonthIndex | None:
+        """The month index, built on first use; None if disabled."""
+        if self._index is None and self._index_years is not None:
+            with self._index_lock:
+                if self._index is None:
+                    self._index = MonthIndex(*self._index_years)
+        return self._index
+
+    def hebrew_date(self, gdate: date) -> SimpleHebrewDate:
+        """Get the Hebrew date of a Gregorian date."""
+        index = self._month_index()
+        if index is not None and index.covers(ordinal := gdate.toordinal()):
+            return SimpleHebrewDate(*index.from_ordinal(ordinal))
+        return self.dates.hebrew_from_gdate(gdate)
+
+    def _month_length(self, year: int, month: int) -> int:
+        """Number of days (29 or 30) in a Hebrew month."""
+        index = self._month_index()
+        if index is not None and index.covers_year(year):
+            return index.month_length(year, month)
+        return hebrew_calendar.month_length(year, month)
+
+    @staticmethod
+    def _next_hebrew_month(cur: dict) -> dict:
+        """Get next Hebrew month (handles year rollover and Adar in leap years)."""
+        month = cur["month"]
+        if month == 14:  # Elul → Tishrei of next year
+            return {"month": 1, "year": cur["year"] + 1}
+        if month == 5 and MoladEngine._is_leap_year(cur["year"]):  # Shevat → Adar I
+            return {"month": 7, "year": cur["year"]}
+        if month in (6, 8):  # Adar / Adar II → Nisan
+            return {"month": 9, "year": cur["year"]}
+        return {"month": month + 1, "year": cur["year"]}
+
+    def next_month_start(self, gdate: date) -> date:
+        """First day of the Hebrew month after the one containing gdate."""
+        table = self._year_table
+        if table is not None and table.starts[0] <= gdate < table.end:
+            i = bisect_right(table.starts, gdate)
+            return table.starts[i] if i < len(table.starts) else table.end
+        index = self._month_index()
+        if index is not None and index.covers(ordinal := gdate.toordinal()):
+            return date.fromordinal(index.starts[index.position(ordinal) + 1])
+        year, month, day = hebrew_calendar.from_ordinal(gdate.toordinal())
+        return gdate + timedelta(days=hebrew_calendar.month_length(year, month) - day + 1)
+
+    def _gdate_from_hebrew(self, hinfo: dict, day: int) -> datetime.date:
+        """Convert Hebrew date to Gregorian date."""
+        index = self._month_index()
+        if index is not None and index.covers_year(hinfo["year"]):
+            return date.fromordinal(index.to_ordinal(hinfo["year"], hinfo["month"], day))
+        return self.dates.gdate_from_hebrew(hinfo["year"], hinfo["month"], day)
+
+    @staticmethod
+    def _dow_name(gdate: datetime.date) -> str:
+        """Get day of week name, using 'Shabbos' for Saturday."""
+        name = gdate.strftime("%A")
+        return "Shabbos" if name == "Saturday" else name
+
+    # === ROSH CHODESH ===
+    def get_rosh_chodesh_days(self, gdate: datetime.date) -> RoshChodesh:
+        """Get Rosh Chodesh information for the next month."""
+        cur = self._hebrew_month_year(gdate)
+        precomputed = self._precomputed(cur)
+        if precomputed is not None:
+            return precomputed[1]
+        return self._rosh_chodesh_for_month(cur["year"], cur["month"])
+
+    def _rosh_chodesh_for_month(self, year: int, month: int) -> RoshChodesh:
+        """Get Rosh Chodesh information for the month after the given Hebrew month."""
+        cur = {"year": year, "month": month}
+        nxt = self._next_hebrew_month(cur)
+        g_second = self._gdate_from_hebrew(nxt, 1)
+        second_dow = self._dow_name(g_second)
+        month_name = hebrew_calendar.MONTH_NAMES[nxt["month"]]
+
+        if nxt["month"] == 1:  # Tishrei (in civil numbering)
+            return RoshChodesh(month_name, "", ())
+
+        if self._month_length(year, month) == 30:
+            g_first = g_second - timedelta(days=1)
+            first_dow = self._dow_name(g_first)
+            return RoshChodesh(month_name, f"{first_dow} & {second_dow}", (first_dow, second_dow), (g_first, g_second))
+        return RoshChodesh(month_name, second_dow, (second_dow,), (g_second,))
+
+    # === SHABBOS MEVORCHIM (FIXED) ===
+    def _shabbos_mevorchim_date(self, gdate: datetime.date) -> datetime.date:
+        """Get the date of Shabbos Mevorchim for the current month."""
+        cur = self._hebrew_month_year(gdate)
+        precomputed = self._precomputed(cur)
+        if precomputed is not None:
+            return precomputed[2]
+        return self._shabbos_mevorchim_for_month(cur["year"], cur["month"])
+
+    def _shabbos_mevorchim_for_month(self, year: int, month: int) -> datetime.date:
+        """Get the date of Shabbos Mevorchim for the given Hebrew month."""
+        length = self._month_length(year, month)
+        has_30_days = length == 30
+        last = self._gdate_from_hebrew({"year": year, "month": month}, length)
+
+        days_back = (last.weekday() - 5) % 7
+        if days_back == 0 and has_30_days:
+            days_back = 7
+        return last - timedelta(days=days_back)
+
+    # === PRECOMPUTED YEAR TABLE ===
+    def build_year_table(self, gdate: date) -> dict:
+        """Precompute molad, Rosh Chodesh and Shabbos Mevorchim for every month of the
+        Hebrew year containing gdate. Returns JSON-serializable data for load_year_table.
+        """
+        year = self.hebrew_date(gdate).year
+        start = hebrew_calendar.rosh_hashana(year)
+        length_of_year = hebrew_calendar.year_length(year)
+        months = []
+        for month in hebrew_calendar.months_in_year(year):
+            molad = self._molad_for_month(year, month)
+            rosh = self._rosh_chodesh_for_month(year, month)
+            months.append(
+                {
+                    "month": month,
+                    "start": date.fromordinal(start).isoformat(),
+                    "molad": asdict(molad),
+                    "rosh_chodesh": {
+                        "month": rosh.month,
+                        "text": rosh.text,
+                        "days": list(rosh.days),
+                        "gdays": [d.isoformat() for d in rosh.gdays],
+                    },
+                    "shabbos_mevorchim": self._shabbos_mevorchim_for_month(year, month).isoformat(),
+                }
+            )
+            start += hebrew_calendar.month_length(year, month, length_of_year)
+        return {"year": year, "end": date.fromordinal(start).isoformat(), "months": months}
+
+    def load_year_table(self, table: dict) -> None:
+        """Serve lookups for the table's Hebrew year from data built by build_year_table."""
+        year = table["year"]
+        starts, keys, results = [], [], {}
+        for entry in table["months"]:
+            rosh = entry["rosh_chodesh"]
+            key = (year, entry["month"])
+            starts.append(date.fromisoformat(entry["start"]))
+            keys.append(key)
+            results[key] = (
+                Molad(**entry["molad"]),
+                RoshChodesh(
+                    rosh["month"], rosh["text"], tuple(rosh["days"]), tuple(date.fromisoformat(d) for d in rosh["gdays"])
+                ),
+                date.fromisoformat(entry["shabbos_mevorchim"]),
+            )
+        self._year_table = _YearTable(year, starts, keys, date.fromisoformat(table["end"]), results)
+
+    def year_table_covers(self, gdate: date) -> bool:
+        """Check if the loaded year table contains gdate."""
+        table = self._year_table
+        return table is not None and table.starts[0] <= gdate < table.end
+
+    def cache_stats(self) -> dict:
+        """Return the date cache and per-month memo statistics."""
+        stats = {"hebrew_dates": self.dates.stats()}
+        index = self._index
+        stats["month_index"] = (
+            None
+            if index is None
+            else {"years": [index.first_year, index.last_year], "months": len(index), "bytes": index.nbytes}
+        )
+        for name in ("_molad_for_month", "_rosh_chodesh_for_month", "_shabbos_mevorchim_for_month"):
+            info = getattr(self, name).cache_info()
+            stats[name.strip("_")] = {
+                "size": info.currsize,
+                "maxsize": info.maxsize,
+                "hits": info.hits,
+                "misses": info.misses,
+            }
+        return stats
+
+    def year_table_span(self) -> tuple[date, date] | None:
+        """First day and the day after the last day of the loaded year table."""
+        table = self._year_table
+        return None if table is None else (table.starts[0], table.end)
+
+    def _precomputed(self, cur: dict) -> tuple[Molad, RoshChodesh, date] | None:
+        """Get the precomputed results for a Hebrew month, if the year table has them."""
+        table = self._year_table
+        if table is None:
+            return None
+        return table.results.get((cur["year"], cur["month"]))
+
+    # === SCHEDULE ===
+    def iter_months(self, gdate: date, count: int | None = None) -> Iterator[ScheduledMonth]:
+        """Yield the `count` (default: unlimited) Hebrew months after the month of gdate.
+
+        Months are walked incrementally: each molad is the previous one plus a lunar
+        month, and each month starts where the previous one ended, so nothing is
+        recomputed from scratch and memory stays constant however many months are taken.
+        """
+        year, month, day = hebrew_calendar.from_ordinal(gdate.toordinal())
+        prev_length = hebrew_calendar.month_length(year, month)
+        start = gdate.toordinal() - day + 1 + prev_length
+        cur = self._next_hebrew_month({"year": year, "month": month})
+        molad = hebrew_calendar.molad_chalakim(cur["year"], self._civil_to_biblical_month(cur["month"]))
+        length_of_year = hebrew_calendar.year_length(cur["year"])
+
+        for _ in repeat(None) if count is None else range(count):
+            first = date.fromordinal(start)
+            if cur["month"] == 1:  # Tishrei: no Rosh Chodesh or Shabbos Mevorchim announcement
+                rosh_chodesh, mevorchim = (), None
+            else:
+                rosh_chodesh = (first - timedelta(days=1), first) if prev_length == 30 else (first,)
+                last = first - timedelta(days=1)
+                days_back = (last.weekday() - 5) % 7
+                if days_back == 0 and prev_length == 30:
+                    days_back = 7
+                mevorchim = last - timedelta(days=days_back)
+
+            molad_obj = self._molad_from_chalakim(molad)
+            yield ScheduledMonth(
+                cur["year"],
+                cur["month"],
+                hebrew_calendar.MONTH_NAMES[cur["month"]],
+                first,
+                molad_obj,
+                molad_obj.jerusalem_time.date(),
+                rosh_chodesh,
+                mevorchim,
+            )
+
+            prev_length = hebrew_calendar.month_length(cur["year"], cur["month"], length_of_year)
+            start += prev_length
+            molad += self.LUNAR_MONTH_CHALAKIM
+            nxt = self._next_hebrew_month(cur)
+            if nxt["year"] != cur["year"]:
+                length_of_year = hebrew_calendar.year_length(nxt["year"])
+            cur = nxt
+
+    def iter_schedule(self, gdate: date, count: int) -> Iterator[dict]:
+        """Yield molad, Rosh Chodesh and Shabbos Mevorchim for the `count` months after
+        the Hebrew month of gdate, as JSON-serializable dicts.
+        """
+        for month in self.iter_months(gdate, count):
+            yield {
+                "hebrew_year": month.hebrew_year,
+                "month_name": month.month_name,
+                "molad": asdict(month.molad),
+                "molad_time": month.molad.jerusalem_time.isoformat(),
+                "rosh_chodesh_dates": [d.isoformat() for d in month.rosh_chodesh],
+                "rosh_chodesh_days": [self._dow_name(d) for d in month.rosh_chodesh],
+                "shabbos_mevorchim": month.shabbos_mevorchim.isoformat() if month.shabbos_mevorchim else None,
+            }
+
+
+class MoladHelper(TimedMethods):
+    """Location-specific calculations (Shabbat zmanim) on top of a shared MoladEngine."""
+
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        time_zone: str,
+        diaspora: bool = True,
+        engine: MoladEngine | None = None,
+    ):
+        # Location-independent work is delegated to a (possibly shared) engine
+        self.engine = engine or MoladEngine()
+        self.dates = self.engine.dates
+        self.latitude = latitude
+        self.longitude = longitude
+        self.time_zone = time_zone
+        self.diaspora = diaspora
+        self.tz = ZoneInfo(time_zone)
+        self.site = Site(latitude, longitude, time_zone, diaspora)
+        # Weekly Shabbat intervals, sorted by Friday (parallel lists, see _add_week)
+        self._fridays: list[date] = []
+        self._starts: list[datetime] = []
+        self._weeks: list[_ShabbatWeek] = []
+
+    # Shabbat weeks kept per helper (a few weeks' worth)
+    WINDOW_CACHE_SIZE = 8
+
+    def _shabbat_week(self, gdate: date) -> _ShabbatWeek:
+        """Get the Shabbat of a Friday or Saturday, computing the week on first use."""
+        friday = gdate - timedelta(days=gdate.weekday() - 4)
+        i = bisect_left(self._fridays, friday)
+        if i < len(self._fridays) and self._fridays[i] == friday:
+            return self._weeks[i]
+        return self._add_week(friday, self._compute_window(friday))
+
+    def _compute_window(self, friday: date) -> ShabbatWindow:
+        return shabbat_windows([self.site], [friday])[0][0]
+
+    def _add_week(self, friday: date, window: ShabbatWindow) -> _ShabbatWeek:
+        """Index a week's Shabbat as the interval [start, end) with its Mevorchim flag."""
+        saturday = friday + timedelta(days=1)
+        start, end = shabbat_interval(friday, window, self.tz)
+        mevorchim = (
+            saturday == self._shabbos_mevorchim_date(saturday)
+            and self._hebrew_date(saturday).month != 14  # not Elul
+        )
+        week = _ShabbatWeek(window, start, end, mevorchim)
+
+        i = bisect_left(self._fridays, friday)
+        self._fridays.insert(i, friday)
+        self._starts.insert(i, start)
+        self._weeks.insert(i, week)
+        if len(self._weeks) > self.WINDOW_CACHE_SIZE:
+            # Drop the week furthest from the one just added
+            drop = -1 if i == 0 else 0
+            del self._fridays[drop], self._starts[drop], self._weeks[drop]
+        return week
+
+    def _week_at(self, now: datetime) -> _ShabbatWeek | None:
+        """The Shabbat that now falls in, if any, by binary search over the intervals."""
+        now = self._aware(now)
+        if now.date().weekday() not in (4, 5):
+            return None
+        self._shabbat_week(now.date())  # make sure this week is indexed
+        i = bisect_right(self._starts, now) - 1
+        if i < 0 or now >= self._weeks[i].end:
+            return None
+        return self._weeks[i]
+
+    def _hebrew_date(self, gdate: date):
+        """Get the Hebrew date of a Gregorian date."""
+        return self.engine.hebrew_date(gdate)
+
+    # === INSTRUMENTATION ===
+    # Hebrew date conversions are timed in the engine (see TimedMethods)
+    TIMED_PHASES = {
+        "get_actual_molad": "molad_arithmetic",
+        "_compute_window": "zmanim",
+        "is_shabbos_mevorchim": "shabbat_detection",
+        "get_rosh_chodesh_days": "rosh_chodesh_lookup",
+    }
+
+    def set_timer(self, timer: PhaseTimer | None) -> None:
+        """Count the phases of every following calculation in timer, or stop with None.
+
+        The shared engine counts in the timer of whichever helper set it last, so
+        callers set it before every calculation.
+        """
+        super().set_timer(timer)
+        self.engine.set_timer(timer)
+
+    # === LOCATION-INDEPENDENT (SHARED ENGINE) ===
+    def get_actual_molad(self, gdate: datetime.date) -> Molad:
+        """Get molad for the NEXT month (upcoming Rosh Chodesh)."""
+        return self.engine.get_actual_molad(gdate)
+
+    def get_rosh_chodesh_days(self, gdate: datetime.date) -> RoshChodesh:
+        """Get Rosh Chodesh information for the next month."""
+        return self.engine.get_rosh_chodesh_days(gdate)
+
+    def _shabbos_mevorchim_date(self, gdate: datetime.date) -> datetime.date:
+        """Get the date of Shabbos Mevorchim for the current month."""
+        return self.engine._shabbos_mevorchim_date(gdate)
+
+    def _shabbos_mevorchim_hebrew_day(self, gdate: datetime.date) -> datetime.date:
+        """Get the Hebrew day of Shabbos Mevorchim."""
+        return self._shabbos_mevorchim_date(gdate)
+
+    # === SHABBOS MEVORCHIM DETECTION (FRIDAY EVENING FIXED) ===
+    def is_shabbos_mevorchim(self, now: datetime) -> bool:
+        """Check if now is Shabbos Mevorchim."""
+        week = self._week_at(now)
+        return week is not None and week.mevorchim
+
+    def is_upcoming_shabbos_mevorchim(self, now: datetime) -> bool:
+        """Check if this week's Shabbos (counting from Sunday) is Shabbos Mevorchim and not over yet."""
+        week = self._shabbat_week(self._week_saturday(now.date()))
+        return week.mevorchim and self._aware(now) < week.end
+
+    @staticmethod
+    def _week_saturday(gdate: date) -> date:
+        """The Saturday ending the Sunday to Saturday week of gdate."""
+        return gdate + timedelta(days=5 - gdate.weekday() if gdate.weekday() < 6 else 6)
+
+    def _aware(self, now: datetime) -> datetime:
+        return now.replace(tzinfo=self.tz) if now.tzinfo is None else now
+
+    # === VALIDITY WINDOWS ===
+    # Each group of get_molad's outputs stays the same until the returned moment.
+
+    def month_valid_until(self, now: datetime) -> datetime:
+        """Molad and Rosh Chodesh: until the next Hebrew month starts."""
+        return self._midnight(self.engine.next_month_start(self._local(now).date()))
+
+    def week_valid_until(self, now: datetime) -> datetime:
+        """is_upcoming_shabbos_mevorchim: until this week's Shabbos Mevorchim ends, else until Sunday."""
+        now = self._local(now)
+        saturday = self._week_saturday(now.date())
+        week = self._shabbat_week(saturday)
+        return week.end if week.mevorchim and now < week.end else self._midnight(saturday + timedelta(days=1))
+
+    def shabbat_valid_until(self, now: datetime) -> datetime:
+        """is_shabbos_mevorchim: until this week's Shabbos Mevorchim starts or ends, else until Sunday."""
+        now = self._local(now)
+        saturday = self._week_saturday(now.date())
+        week = self._shabbat_week(saturday)
+        if week.mevorchim and now < week.start:
+            return week.start
+        return week.end if week.mevorchim and now < week.end else self._midnight(saturday + timedelta(days=1))
+
+    def _local(self, now: datetime) -> datetime:
+        return now.replace(tzinfo=self.tz) if now.tzinfo is None else now.astimezone(self.tz)
+
+    def _midnight(self, gdate: date) -> datetime:
+        return datetime.combine(gdate, time.min, tzinfo=self.tz)
+
+    def get_molad(self, now: datetime) -> MoladDetails:
+        """Get complete Molad information for display."""
+        molad_obj = self.get_actual_molad(now.date())
+        shabbos_now = self.is_shabbos_mevorchim(now)
+        shabbos_next = self.is_upcoming_shabbos_mevorchim(now)
+        rosh = self.get_rosh_chodesh_days(now.date())
+        return MoladDetails(molad_obj, shabbos_now, shabbos_next, rosh)
+
+
+def prime_shabbat_windows(helpers: Sequence[MoladHelper], fridays: Sequence[date]) -> None:
+    """Compute the Shabbat windows of many helpers (sites) in one batch and cache them
+    in each helper, so their following Shabbat checks for those weeks do no solar math.
+    """
+    missing = [helper for helper in helpers if any(friday not in helper._fridays for friday in fridays)]
+    if not missing:
+        return
+    for helper, row in zip(missing, shabbat_windows([helper.site for helper in missing], fridays)):
+        for friday, window in zip(fridays, row):
+            if friday not in helper._fridays:
+                helper._add_week(friday, window)
@@ -0,0 +1,87 @@
+"""Compact index of Hebrew month boundaries over a span of years."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+
+from . import hebrew_calendar
+
+
+class MonthIndex:
+    """Month starts of Hebrew years first_year..last_year in parallel typed arrays.
+
+    starts holds the Gregorian ordinal of day 1 of every month in order, plus one
+    more for the day after the last month, with the year, month (CIVIL numbering)
+    and length of each month alongside; year_starts holds the position of each
+    year's Tishrei. A Gregorian date's month is one bisection, and everything
+    else is an array read. Each month takes 8 bytes, so ten thousand years fit
+    in about a megabyte.
+    """
+
+    def __init__(self, first_year: int, last_year: int):
+        if not 1 <= first_year <= last_year:
+            raise ValueError("years must be positive and in order")
+        self.first_year = first_year
+        self.last_year = last_year
+        self.starts = array("i")
+        self.years = array("H")
+        self.months = array("B")
+        self.lengths = array("B")
+        self.year_starts = array("i")
+
+        ordinal = hebrew_calendar.rosh_hashana(first_year)
+        for year in range(first_year, last_year + 1):
+            self.year_starts.append(len(self.starts))
+            length_of_year = hebrew_calendar.year_length(year)
+            for month in hebrew_calendar.months_in_year(year):
+                length = hebrew_calendar.month_length(year, month, length_of_year)
+                self.starts.append(ordinal)
+                self.years.append(year)
+                self.months.append(month)
+                self.lengths.append(length)
+                ordinal += length
+        self.starts.append(ordinal)
+        self.year_starts.append(len(self.months))
+
+    def __len__(self) -> int:
+        return len(self.months)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the arrays."""
+        return sum(
+            a.itemsize * len(a) for a in (self.starts, self.years, self.months, self.lengths, self.year_starts)
+        )
+
+    def covers(self, ordinal: int) -> bool:
+        """Check if a Gregorian ordinal falls within the indexed years."""
+        return self.starts[0] <= ordinal < self.starts[-1]
+
+    def covers_year(self, year: int) -> bool:
+        return self.first_year <= year <= self.last_year
+
+    def position(self, ordinal: int) -> int:
+        """Position of the month containing a Gregorian ordinal, which must be covered."""
+        return bisect_right(self.starts, ordinal) - 1
+
+    def position_of(self, year: int, month: int) -> int:
+        """Position of a Hebrew month, which must exist in a covered year."""
+        return self.year_starts[year - self.first_year] + hebrew_calendar.months_in_year(year).index(month)
+
+    def from_ordinal(self, ordinal: int) -> tuple[int, int, int]:
+        """Hebrew (year, month, day) of a covered Gregorian ordinal."""
+        i = self.position(ordinal)
+        return self.years[i], self.months[i], ordinal - self.starts[i] + 1
+
+    def to_ordinal(self, year: int, month: int, day: int) -> int:
+        """Gregorian ordinal of a Hebrew date in a covered year. Raises ValueError if it does not exist."""
+        if month not in hebrew_calendar.months_in_year(year):
+            raise ValueError(f"Hebrew date {year}-{month}-{day} does not exist")
+        i = self.position_of(year, month)
+        if not 1 <= day <= self.lengths[i]:
+            raise ValueError(f"Hebrew date {year}-{month}-{day} does not exist")
+        return self.starts[i] + day - 1
+
+    def month_length(self, year: int, month: int) -> int:
+        """Number of days (29 or 30) in a Hebrew month of a covered year."""
+        return self.lengths[self.position_of(year, month)]
@@ -0,0 +1,100 @@
+"""Run molad calculations under cProfile and summarize the hot functions."""
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+import cProfile
+from datetime import datetime, timedelta
+import io
+import os
+import pstats
+from time import perf_counter
+from typing import Any
+
+from .helper import MoladHelper
+
+# On Python 3.12+ cProfile records every thread, including Home Assistant's event
+# loop while the profile runs in an executor, so the summary is limited to these
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEPENDENCIES = ("hdate", "astral")
+
+
+def _in_scope(filename: str) -> bool:
+    """Check if a profiled function belongs to the integration or its calculation dependencies."""
+    path = os.path.abspath(filename)
+    return path.startswith(PACKAGE_DIR + os.sep) or any(f"{os.sep}{name}{os.sep}" in path for name in DEPENDENCIES)
+
+# Step name -> one call of it for a moment. Names match the diagnostics phases
+# (MoladHelper.TIMED_PHASES) where there is one.
+STEPS: dict[str, Callable[[MoladHelper, datetime], Any]] = {
+    "get_molad": lambda helper, now: helper.get_molad(now),
+    "molad_arithmetic": lambda helper, now: helper.get_actual_molad(now.date()),
+    "hebrew_date_conversion": lambda helper, now: helper._hebrew_date(now.date()),
+    # Bypasses the weekly cache, so every call does the solar math for the Friday on or before now
+    "zmanim": lambda helper, now: helper._compute_window(now.date() - timedelta(days=(now.weekday() - 4) % 7)),
+    "shabbat_detection": lambda helper, now: helper.is_shabbos_mevorchim(now),
+    "rosh_chodesh_lookup": lambda helper, now: helper.get_rosh_chodesh_days(now.date()),
+    "validity_windows": lambda helper, now: (
+        helper.month_valid_until(now),
+        helper.week_valid_until(now),
+        helper.shabbat_valid_until(now),
+    ),
+}
+
+
+def profile_step(
+    helper: MoladHelper, step: str, moments: Sequence[datetime], iterations: int, path: str, limit: int = 20
+) -> dict[str, Any]:
+    """Call a step for every moment, `iterations` times over, under cProfile.
+
+    The full statistics, sorted by self time and by cumulative time, are written
+    to path as text; they can include other threads' work. Returns a
+    JSON-serializable summary with the `limit` functions of the integration (and
+    hdate and astral) with the most self time.
+    """
+    call = STEPS[step]
+    profiler = cProfile.Profile()
+    start = perf_counter()
+    profiler.enable()
+    try:
+        for _ in range(iterations):
+            for now in moments:
+                call(helper, now)
+    finally:
+        profiler.disable()
+    elapsed_ms = (perf_counter() - start) * 1000
+    calls = iterations * len(moments)
+
+    with open(path, "w", encoding="utf-8") as out:
+        out.write(f"molad profile of {step}: {calls} calls in {elapsed_ms:.1f} ms (with profiling overhead)\n")
+        out.write("Functions run by other threads meanwhile (e.g. Home Assistant's) may be included.\n")
+        for sort in (pstats.SortKey.TIME, pstats.SortKey.CUMULATIVE):
+            out.write(f"\n=== sorted by {sort.value} ===\n")
+            pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats()
+
+    stats = pstats.Stats(profiler, stream=io.StringIO()).sort_stats(pstats.SortKey.TIME)
+    functions = []
+    # Built-ins (file "~") count when the integration calls them
+    in_scope = [
+        func
+        for func in stats.fcn_list
+        if _in_scope(func[0]) or (func[0] == "~" and any(_in_scope(caller[0]) for caller in stats.stats[func][4]))
+    ]
+    for func in in_scope[:limit]:
+        _, total_calls, self_time, cumulative, _ = stats.stats[func]
+        filename, line, name = func
+        functions.append(
+            {
+                "function": f"{os.path.basename(filename)}:{line}({name})",
+                "calls": total_calls,
+                "self_ms": round(self_time * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3),
+            }
+        )
+    return {
+        "step": step,
+        "calls": calls,
+        "total_ms": round(elapsed_ms, 3),
+        "mean_ms": round(elapsed_ms / calls, 4) if calls else 0.0,
+        "file": path,
+        "functions": functions,
+    }
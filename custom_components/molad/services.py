@@ -0,0 +1,121 @@
+"""Services for the Molad integration."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_END_DATE,
+    ATTR_ITERATIONS,
+    ATTR_LIMIT,
+    ATTR_MONTHS,
+    ATTR_START_DATE,
+    ATTR_STEP,
+    DATA_ENGINE,
+    DEFAULT_DIASPORA,
+    DEFAULT_PROFILE_DAYS,
+    DEFAULT_SCHEDULE_MONTHS,
+    DOMAIN,
+    MAX_PROFILE_DAYS,
+    MAX_PROFILE_ITERATIONS,
+    MAX_SCHEDULE_MONTHS,
+    SERVICE_GET_SCHEDULE,
+    SERVICE_PROFILE,
+)
+from .helper import MoladEngine, MoladHelper
+from .profiling import STEPS, profile_step
+
+GET_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_MONTHS, default=DEFAULT_SCHEDULE_MONTHS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_SCHEDULE_MONTHS)
+        ),
+        vol.Optional(ATTR_START_DATE): cv.date,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_STEP, default="get_molad"): vol.In(list(STEPS)),
+        vol.Optional(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_ITERATIONS, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_ITERATIONS)
+        ),
+        vol.Optional(ATTR_LIMIT, default=20): vol.All(vol.Coerce(int), vol.Range(min=1, max=200)),
+    }
+)
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Molad services."""
+    # One profile at a time: only one profiler can be active in the interpreter
+    profile_lock = asyncio.Lock()
+
+    async def async_get_schedule(call: ServiceCall) -> ServiceResponse:
+        """Return molad, Rosh Chodesh and Shabbos Mevorchim for the coming months."""
+        start = call.data.get(ATTR_START_DATE) or dt_util.now().date()
+        # Works before any entry is set up; the shared engine is only reused when present
+        engine = hass.data.get(DOMAIN, {}).get(DATA_ENGINE) or MoladEngine()
+        months = await hass.async_add_executor_job(
+            lambda: list(engine.iter_schedule(start, call.data[ATTR_MONTHS]))
+        )
+        return {ATTR_MONTHS: months}
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile a calculation step over a date range and write the stats to the config directory."""
+        now = dt_util.now()
+        start = call.data.get(ATTR_START_DATE) or now.date()
+        end = call.data.get(ATTR_END_DATE) or start + timedelta(days=DEFAULT_PROFILE_DAYS - 1)
+        if not 0 <= (end - start).days < MAX_PROFILE_DAYS:
+            raise HomeAssistantError(f"end_date must be on or after start_date and within {MAX_PROFILE_DAYS} days")
+
+        # A fresh helper, so the profile includes the work a restart would redo and the
+        # running entries' caches are left alone; every day is taken at the current time of day
+        diaspora = next(
+            (entry.data.get("diaspora", DEFAULT_DIASPORA) for entry in hass.config_entries.async_entries(DOMAIN)),
+            DEFAULT_DIASPORA,
+        )
+        helper = MoladHelper(
+            hass.config.latitude, hass.config.longitude, str(hass.config.time_zone), diaspora, MoladEngine()
+        )
+        moments = [
+            datetime.combine(start + timedelta(days=day), now.timetz()) for day in range((end - start).days + 1)
+        ]
+        path = hass.config.path(f"molad_profile_{now:%Y%m%d_%H%M%S}.txt")
+
+        # Not the calculation lock: the profile uses its own helper and engine, so it
+        # shares nothing with the entries and must not hold up their refreshes
+        async with profile_lock:
+            summary = await hass.async_add_executor_job(
+                profile_step,
+                helper,
+                call.data[ATTR_STEP],
+                moments,
+                call.data[ATTR_ITERATIONS],
+                path,
+                call.data[ATTR_LIMIT],
+            )
+        return {**summary, ATTR_START_DATE: start.isoformat(), ATTR_END_DATE: end.isoformat()}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SCHEDULE,
+        async_get_schedule,
+        schema=GET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
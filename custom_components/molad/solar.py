@@ -0,0 +1,283 @@
+"""Batched candle lighting and havdalah times for many sites and dates.
+
+Reproduces hdate 1.1.2's Zmanim to the minute without building Zmanim objects:
+sunset and three stars come from the NOAA solar equations as implemented by
+astral's time_of_transit (hdate's method up to 50 degrees latitude) or from the
+NOAA low accuracy equations (hdate's method beyond that), with the same
+operations in the same order so the floating point results are identical.
+Candle lighting is 18 minutes before sunset and havdalah is at three stars
+(the sun 8.5 degrees below the horizon), with hdate's Yom Tov rules.
+
+Everything that depends only on the date (Julian century, declination and
+equation of time for the first iteration) is computed once per date and shared
+by all sites; only the refinement step is per site.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from math import acos, asin, cos, degrees, pi, radians, sin, tan
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+from . import hebrew_calendar
+
+CANDLE_LIGHTING_MINUTES = 18
+# hdate's zeniths: astral's apparent solar radius for sunset, 90.833 in the NOAA fallback
+SUNSET_ZENITH = 90.0 + 32.0 / (60.0 * 2.0)
+SUNSET_ZENITH_NOAA = 90.833
+THREE_STARS_ZENITH = 98.5
+# hdate switches from astral to the low accuracy equations beyond this latitude
+MAX_LATITUDE_ASTRAL = 50.0
+
+
+@dataclass(frozen=True, slots=True)
+class Site:
+    """A location to compute Shabbat times for."""
+
+    latitude: float
+    longitude: float
+    time_zone: str
+    diaspora: bool = True
+
+
+class ShabbatWindow(NamedTuple):
+    """Friday candle lighting and Saturday havdalah, in the site's time zone.
+
+    Either is None when hdate has none: havdalah before a Yom Tov on Sunday.
+    """
+
+    start: datetime | None
+    end: datetime | None
+
+
+def shabbat_interval(friday: date, window: ShabbatWindow, tz: tzinfo) -> tuple[datetime, datetime]:
+    """The Shabbat of a window as the interval [start, end) that counts as Shabbat.
+
+    Without candle lighting Shabbat starts at midnight. Friday evening always
+    counts, so the interval ends no earlier than midnight either: without
+    havdalah (Yom Tov on Sunday), or where the sun never gets low enough for
+    three stars and the calculated time wraps around to Friday. Only Friday
+    and Saturday count at all, whatever the calculated times.
+    """
+    friday_start, midnight, sunday_start = (
+        datetime.combine(friday + timedelta(days=offset), time.min, tzinfo=tz) for offset in range(3)
+    )
+    start = min(max(window.start or midnight, friday_start), midnight)
+    end = min(max(window.end or midnight, midnight), sunday_start)
+    return start, end
+
+
+def shabbat_windows(sites: Sequence[Site], fridays: Sequence[date]) -> list[list[ShabbatWindow]]:
+    """Shabbat windows for every site (outer list) and Friday (inner list)."""
+    saturdays = [friday + timedelta(days=1) for friday in fridays]
+    sunsets = _setting_minutes(fridays, sites, SUNSET_ZENITH, SUNSET_ZENITH_NOAA)
+    three_stars = _setting_minutes(saturdays, sites, THREE_STARS_ZENITH, THREE_STARS_ZENITH)
+    # Hebrew dates of Friday, Saturday and Sunday, shared by all sites
+    hebrew = [
+        [hebrew_calendar.from_ordinal(friday.toordinal() + offset) for offset in range(3)] for friday in fridays
+    ]
+
+    windows = []
+    for s, site in enumerate(sites):
+        tz = ZoneInfo(site.time_zone)
+        row = []
+        for d, friday in enumerate(fridays):
+            yom_tov = [hebrew_calendar.is_yom_tov(month, day, site.diaspora) for _, month, day in hebrew[d]]
+            if yom_tov[0] and yom_tov[1]:
+                # Yom Tov into Shabbat: candles are lit from the existing flame after three stars
+                minutes = _setting_minutes([friday], [site], THREE_STARS_ZENITH, THREE_STARS_ZENITH)[0][0]
+                start = _local(friday, minutes, tz)
+            else:
+                start = _local(friday, sunsets[d][s], tz) - timedelta(minutes=CANDLE_LIGHTING_MINUTES)
+            # No havdalah when Shabbat runs into Yom Tov
+            end = None if yom_tov[2] else _local(saturdays[d], three_stars[d][s], tz)
+            row.append(ShabbatWindow(start, end))
+        windows.append(row)
+    return windows
+
+
+def _local(gdate: date, minutes: int, tz: ZoneInfo) -> datetime:
+    """Local time of a UTC minute offset from midnight of gdate, as hdate's Zman builds it."""
+    utc = datetime.combine(gdate, time(), tzinfo=timezone.utc) + timedelta(minutes=minutes)
+    return utc.astimezone(tz)
+
+
+def _setting_minutes(
+    dates: Sequence[date], sites: Sequence[Site], zenith: float, zenith_noaa: float
+) -> list[list[int]]:
+    """Whole UTC minutes from midnight at which the setting sun reaches a zenith, per date and site."""
+    astral_sites = [abs(site.latitude) <= MAX_LATITUDE_ASTRAL for site in sites]
+    results = [[0] * len(sites) for _ in dates]
+
+    if any(astral_sites):
+        refracted = zenith + _refraction_at_zenith(zenith)
+        cos_zenith = cos(radians(refracted))
+        observers = [
+            (s, radians(site.latitude), site.longitude) for s, site in enumerate(sites) if astral_sites[s]
+        ]
+        for d, gdate in enumerate(dates):
+            jd = _julianday(gdate)
+            jc = (jd - 2451545.0) / 36525.0
+            declination = radians(_sun_declination(jc))
+            eqtime = _eq_of_time(jc)
+            for s, latitude, longitude in observers:
+                # First pass with the date's terms, then refine at the estimated time
+                time_utc = _transit_minutes(latitude, longitude, declination, eqtime, cos_zenith)
+                jc = (jd + time_utc / 1440.0 - 2451545.0) / 36525.0
+                time_utc = _transit_minutes(
+                    latitude, longitude, radians(_sun_declination(jc)), _eq_of_time(jc), cos_zenith
+                )
+                results[d][s] = _rounded_minutes(time_utc)
+
+    if not all(astral_sites):
+        sunset_angle = radians(zenith_noaa)
+        observers = [(s, radians(site.latitude), site.longitude) for s, site in enumerate(sites) if not astral_sites[s]]
+        for d, gdate in enumerate(dates):
+            eqtime, declination = _noaa_terms(gdate)
+            for s, latitude, longitude in observers:
+                try:
+                    hour_angle = acos(
+                        cos(sunset_angle) / (cos(latitude) * cos(declination)) - tan(latitude) * tan(declination)
+                    )
+                except ValueError:  # the sun never gets that low
+                    results[d][s] = -720
+                    continue
+                hour_angle = 720.0 * hour_angle / pi
+                results[d][s] = int(720.0 - 4.0 * longitude + hour_angle - eqtime)
+
+    return results
+
+
+def _transit_minutes(latitude: float, longitude: float, declination: float, eqtime: float, cos_zenith: float) -> float:
+    """One iteration of astral's time_of_transit for a setting sun. Angles in radians."""
+    h = (cos_zenith - sin(latitude) * sin(declination)) / (cos(latitude) * cos(declination))
+    hour_angle = -acos(h)
+    delta = -longitude - degrees(hour_angle)
+    offset = delta * 4.0 - eqtime
+    if offset < -720.0:
+        offset += 1440
+    return 720.0 + offset
+
+
+def _rounded_minutes(minutes: float) -> int:
+    """Round like astral's minutes_to_timedelta followed by hdate's _datetime_to_minutes_offest."""
+    days = int(minutes / 1440)
+    seconds = (minutes - days * 1440) * 60
+    whole = int(seconds)
+    micros = days * 86_400_000_000 + whole * 1_000_000 + int((seconds - whole) * 1_000_000)
+    total_minutes, rest = divmod(micros // 1_000_000, 60)
+    return total_minutes + (1 if rest >= 30 else 0)
+
+
+def _julianday(gdate: date) -> float:
+    """Julian day at the start of a Gregorian date (astral.julian.julianday)."""
+    year, month, day = gdate.year, gdate.month, gdate.day
+    if month <= 2:
+        year -= 1
+        month += 12
+    a = int(year / 100)
+    b = 2 - a + int(a / 4)
+    return int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + 0 + b - 1524.5
+
+
+def _refraction_at_zenith(zenith: float) -> float:
+    """Atmospheric refraction in degrees (astral.refraction_at_zenith)."""
+    elevation = 90 - zenith
+    if elevation >= 85.0:
+        return 0
+    te = tan(radians(elevation))
+    if elevation > 5.0:
+        correction = 58.1 / te - 0.07 / (te * te * te) + 0.000086 / (te * te * te * te * te)
+    elif elevation > -0.575:
+        step1 = -12.79 + elevation * 0.711
+        step2 = 103.4 + elevation * step1
+        step3 = -518.2 + elevation * step2
+        correction = 1735.0 + elevation * step3
+    else:
+        correction = -20.774 / te
+    return correction / 3600.0
+
+
+# Solar position for a Julian century, as in astral.sun
+def _geom_mean_long_sun(jc: float) -> float:
+    return (280.46646 + jc * (36000.76983 + 0.0003032 * jc)) % 360.0
+
+
+def _geom_mean_anomaly_sun(jc: float) -> float:
+    return 357.52911 + jc * (35999.05029 - 0.0001537 * jc)
+
+
+def _eccentric_location_earth_orbit(jc: float) -> float:
+    return 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+
+
+def _sun_eq_of_center(jc: float) -> float:
+    mrad = radians(_geom_mean_anomaly_sun(jc))
+    sinm = sin(mrad)
+    sin2m = sin(mrad + mrad)
+    sin3m = sin(mrad + mrad + mrad)
+    return (
+        sinm * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + sin2m * (0.019993 - 0.000101 * jc)
+        + sin3m * 0.000289
+    )
+
+
+def _sun_apparent_long(jc: float) -> float:
+    true_long = _geom_mean_long_sun(jc) + _sun_eq_of_center(jc)
+    omega = 125.04 - 1934.136 * jc
+    return true_long - 0.00569 - 0.00478 * sin(radians(omega))
+
+
+def _obliquity_correction(jc: float) -> float:
+    seconds = 21.448 - jc * (46.815 + jc * (0.00059 - jc * (0.001813)))
+    e0 = 23.0 + (26.0 + (seconds / 60.0)) / 60.0
+    omega = 125.04 - 1934.136 * jc
+    return e0 + 0.00256 * cos(radians(omega))
+
+
+def _sun_declination(jc: float) -> float:
+    sint = sin(radians(_obliquity_correction(jc))) * sin(radians(_sun_apparent_long(jc)))
+    return degrees(asin(sint))
+
+
+def _eq_of_time(jc: float) -> float:
+    l0 = _geom_mean_long_sun(jc)
+    e = _eccentric_location_earth_orbit(jc)
+    m = _geom_mean_anomaly_sun(jc)
+    y = tan(radians(_obliquity_correction(jc)) / 2.0)
+    y = y * y
+
+    sin2l0 = sin(2.0 * radians(l0))
+    sinm = sin(radians(m))
+    cos2l0 = cos(2.0 * radians(l0))
+    sin4l0 = sin(4.0 * radians(l0))
+    sin2m = sin(2.0 * radians(m))
+
+    etime = y * sin2l0 - 2.0 * e * sinm + 4.0 * e * y * sinm * cos2l0 - 0.5 * y * y * sin4l0 - 1.25 * e * e * sin2m
+    return degrees(etime) * 4.0
+
+
+def _noaa_terms(gdate: date) -> tuple[float, float]:
+    """Equation of time (minutes) and declination (radians), NOAA low accuracy equations."""
+    day_of_year = float((gdate - date(gdate.year, 1, 1)).days)
+    gama = 2.0 * pi * ((day_of_year - 1) / 365.0)
+    eqtime = 229.18 * (
+        0.000075
+        + 0.001868 * cos(gama)
+        - 0.032077 * sin(gama)
+        - 0.014615 * cos(2.0 * gama)
+        - 0.040849 * sin(2.0 * gama)
+    )
+    declination = (
+        0.006918
+        - 0.399912 * cos(gama)
+        + 0.070257 * sin(gama)
+        - 0.006758 * cos(2.0 * gama)
+        + 0.000907 * sin(2.0 * gama)
+        - 0.002697 * cos(3.0 * gama)
+        + 0.00148 * sin(3.0 * gama)
+    )
+    return eqtime, declination
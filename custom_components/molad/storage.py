@@ -0,0 +1,58 @@
+"""Persisted precomputed Hebrew-year calendar for the Molad integration."""
+from __future__ import annotations
+
+from datetime import date
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .helper import MoladEngine
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.calendar"
+STORAGE_VERSION = 2  # 2: molads carry absolute_chalakim
+
+
+class _CalendarStorage(Store[dict]):
+    """Store that discards tables saved by older versions instead of migrating them."""
+
+    async def _async_migrate_func(self, old_major_version: int, old_minor_version: int, old_data: dict) -> None:
+        """The table is a cache of pure calculations, so it is simply rebuilt."""
+        return None
+
+
+class MoladCalendarStore:
+    """Keep the shared engine's year table loaded, persisting it across restarts.
+
+    The table only holds location-independent data (molad, Rosh Chodesh and
+    Shabbos Mevorchim dates), so it is rebuilt at the Hebrew year boundary only.
+    """
+
+    def __init__(self, hass: HomeAssistant, engine: MoladEngine):
+        self._hass = hass
+        self._engine = engine
+        self._store: Store[dict] = _CalendarStorage(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._loaded = False
+
+    async def async_ensure_year(self, today: date) -> None:
+        """Make sure the engine has the table for the Hebrew year containing today."""
+        if self._engine.year_table_covers(today):
+            return
+
+        if not self._loaded:
+            self._loaded = True
+            if (data := await self._store.async_load()) is not None:
+                try:
+                    self._engine.load_year_table(data)
+                except (KeyError, TypeError, ValueError) as err:
+                    _LOGGER.warning("Ignoring invalid stored molad calendar: %s", err)
+                if self._engine.year_table_covers(today):
+                    return
+
+        _LOGGER.debug("Building molad calendar for the Hebrew year containing %s", today)
+        table = await self._hass.async_add_executor_job(self._engine.build_year_table, today)
+        self._engine.load_year_table(table)
+        await self._store.async_save(table)
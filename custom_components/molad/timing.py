@@ -0,0 +1,94 @@
+"""Per-phase timing counters for the molad calculation pipeline."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import wraps
+import threading
+from time import perf_counter_ns
+from typing import Any
+
+
+class PhaseTimer:
+    """Accumulate call counts and self time (nanoseconds) per named phase.
+
+    Phases can nest; time spent in an inner phase is only counted there, so the
+    phases of one calculation add up to its total. Nothing is measured unless a
+    function has been wrapped with timed(), so a disabled timer costs nothing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._phases: dict[str, list[int]] = {}  # name -> [calls, self ns, max self ns]
+
+    def timed(self, phase: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap func so every call is counted under phase."""
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = self._stack()
+            stack.append(0)  # time spent in nested phases
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                self._record(phase, elapsed - stack.pop())
+                if stack:
+                    stack[-1] += elapsed
+
+        return wrapper
+
+    def _stack(self) -> list[int]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, phase: str, self_ns: int) -> None:
+        with self._lock:
+            counters = self._phases.setdefault(phase, [0, 0, 0])
+            counters[0] += 1
+            counters[1] += self_ns
+            counters[2] = max(counters[2], self_ns)
+
+    def reset(self) -> None:
+        """Drop all counters."""
+        with self._lock:
+            self._phases.clear()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return calls, total and mean/max self time (ms) per phase."""
+        with self._lock:
+            return {
+                phase: {
+                    "calls": calls,
+                    "total_ms": round(total / 1e6, 3),
+                    "mean_ms": round(total / calls / 1e6, 3),
+                    "max_ms": round(most / 1e6, 3),
+                }
+                for phase, (calls, total, most) in self._phases.items()
+            }
+
+
+class TimedMethods:
+    """Mixin counting the methods named in TIMED_PHASES once a PhaseTimer is set.
+
+    Enabled per instance by shadowing the methods with timed wrappers, so the
+    normal (untimed) path has no overhead at all.
+    """
+
+    # Method -> phase name
+    TIMED_PHASES: dict[str, str] = {}
+    timer: PhaseTimer | None = None
+
+    def set_timer(self, timer: PhaseTimer | None) -> None:
+        """Count the phases of every following calculation in timer, or stop with None."""
+        if timer is self.timer:
+            return
+        for name in self.TIMED_PHASES:
+            self.__dict__.pop(name, None)
+        if timer is not None:
+            for name, phase in self.TIMED_PHASES.items():
+                setattr(self, name, timer.timed(phase, getattr(type(self), name).__get__(self)))
+        self.timer = timer
@@ -0,0 +1,134 @@
+"""Websocket API for the Molad integration.
+
+molad/subscribe sends the current sensor.molad attributes (plus the molad time)
+and the schedule of the coming months once, then pushes only what changes:
+the attributes that differ whenever the coordinator's data changes, and when a
+new Hebrew month starts, how many months to drop from the front of the schedule
+and which to append. A dashboard card keeps its copy up to date from these
+events without polling. The schedule is computed once per entry and day, for the
+most months any subscriber asked for, and sliced for each. When the entry is
+unloaded or reloaded, a last event with unloaded set ends the subscription, and
+the card subscribes again.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import ATTR_MOLAD_TIME, ATTR_MONTHS, DEFAULT_SCHEDULE_MONTHS, DOMAIN, MAX_SCHEDULE_MONTHS
+from .coordinator import MoladDataUpdateCoordinator
+from .helper import MoladDetails
+from .sensor import molad_attributes
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the Molad websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+def _snapshot(details: MoladDetails) -> dict[str, Any]:
+    return {**molad_attributes(details), ATTR_MOLAD_TIME: details.molad.jerusalem_time.isoformat()}
+
+
+def _schedule_delta(old: list[dict], new: list[dict]) -> tuple[int, list[dict]]:
+    """How many months to drop from the front of old, and which to append, to get new."""
+    keys = [(month["hebrew_year"], month["month_name"]) for month in old]
+    try:
+        shift = keys.index((new[0]["hebrew_year"], new[0]["month_name"])) if new else len(old)
+    except ValueError:
+        shift = len(old)
+    return shift, new[len(old) - shift :]
+
+
+def _coordinator(hass: HomeAssistant, entry_id: str | None) -> MoladDataUpdateCoordinator | None:
+    """The coordinator of an entry, or of the first one set up."""
+    data = hass.data.get(DOMAIN, {})
+    if entry_id is not None:
+        coordinator = data.get(entry_id)
+    else:
+        coordinator = next((v for v in data.values() if isinstance(v, MoladDataUpdateCoordinator)), None)
+    return coordinator if isinstance(coordinator, MoladDataUpdateCoordinator) else None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "molad/subscribe",
+        vol.Optional("entry_id"): str,
+        vol.Optional(ATTR_MONTHS, default=DEFAULT_SCHEDULE_MONTHS): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MAX_SCHEDULE_MONTHS)
+        ),
+    }
+)
+@websocket_api.async_response
+async def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send the molad details and schedule, then push changes to them."""
+    msg_id = msg["id"]
+    coordinator = _coordinator(hass, msg.get("entry_id"))
+    if coordinator is None or coordinator.data is None:
+        connection.send_error(msg_id, websocket_api.ERR_NOT_FOUND, "Molad is not set up")
+        return
+
+    months = msg[ATTR_MONTHS]
+
+    async def async_get_schedule() -> list[dict]:
+        # One computation per coordinator for all subscribers, each taking its slice
+        return await coordinator.async_get_schedule(months) if months else []
+
+    schedule = await async_get_schedule()
+    state = _snapshot(coordinator.data)
+
+    async def async_send_schedule_delta() -> None:
+        nonlocal schedule
+        new = await async_get_schedule()
+        if msg_id not in connection.subscriptions:
+            return
+        shift, append = _schedule_delta(schedule, new)
+        schedule = new
+        if shift or append:
+            connection.send_message(
+                websocket_api.event_message(msg_id, {"schedule_shift": shift, "schedule_append": append})
+            )
+
+    @callback
+    def async_handle_update() -> None:
+        """Send the attributes that changed; the coordinator only calls this when its data did."""
+        nonlocal state
+        if coordinator.data is None:
+            return
+        new = _snapshot(coordinator.data)
+        delta = {key: value for key, value in new.items() if state.get(key) != value}
+        if not delta:
+            return
+        state = new
+        connection.send_message(websocket_api.event_message(msg_id, {"delta": delta}))
+        # A different molad means a new Hebrew month, so the schedule moves on
+        if months and ATTR_MOLAD_TIME in delta:
+            hass.async_create_task(async_send_schedule_delta())
+
+    remove_listener = coordinator.async_add_listener(async_handle_update)
+
+    @callback
+    def async_handle_shutdown() -> None:
+        """End the subscription when the entry is unloaded or reloaded."""
+        if connection.subscriptions.pop(msg_id, None) is None:
+            return
+        remove_listener()
+        connection.send_message(websocket_api.event_message(msg_id, {"unloaded": True}))
+
+    remove_shutdown = coordinator.async_on_shutdown(async_handle_shutdown)
+
+    @callback
+    def async_unsubscribe() -> None:
+        remove_listener()
+        remove_shutdown()
+
+    connection.subscriptions[msg_id] = async_unsubscribe
+    connection.send_result(msg_id)
+    connection.send_message(websocket_api.event_message(msg_id, {"snapshot": state, "schedule": schedule}))